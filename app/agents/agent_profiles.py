@@ -54,15 +54,19 @@ AGENTS: dict[str, AgentProfile] = {
 }
 
 
+# Settings attribute holding each agent's ElevenLabs ID
+_AGENT_ID_SETTINGS = {
+    "maya": "elevenlabs_agent_id_maya",
+    "barnaby": "elevenlabs_agent_id_barnaby",
+    "consultant": "elevenlabs_agent_id_consultant",
+    "rutger": "elevenlabs_agent_id_rutger",
+}
+
+
 def get_agent_id(slug: str, settings) -> str:
     """Return the ElevenLabs agent ID for a given slug, or empty string."""
-    mapping = {
-        "maya": settings.elevenlabs_agent_id_maya,
-        "barnaby": settings.elevenlabs_agent_id_barnaby,
-        "consultant": settings.elevenlabs_agent_id_consultant,
-        "rutger": settings.elevenlabs_agent_id_rutger,
-    }
-    return mapping.get(slug, "")
+    attr = _AGENT_ID_SETTINGS.get(slug)
+    return getattr(settings, attr) if attr else ""
 
 
 def get_voice_id(slug: str, settings) -> str:
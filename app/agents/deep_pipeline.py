@@ -97,6 +97,7 @@ async def execute_deep_research(
 
     Args:
         on_progress: Optional callback(phase, **kwargs) for reporting progress.
+            Completed-study events also carry the StudyResult as ``study_result``.
     """
     def _progress(phase, **kwargs):
         if on_progress:
@@ -260,7 +261,7 @@ async def execute_deep_research(
                             sr = await _run_deep_research_study(idx, study_dict)
                         if sr.synthesis:
                             _progress(f"Completed: {title}", step=f"study_{idx}",
-                                      study_idx=idx, study_status="done")
+                                      study_idx=idx, study_status="done", study_result=sr)
                             result.studies[idx] = sr
                             async with _cp_lock:
                                 _checkpoint(result, "studies_partial")
@@ -290,7 +291,7 @@ async def execute_deep_research(
                                 researcher_builder=researcher_builder,
                             )
                             _progress(f"Completed: {title}", step=f"study_{idx}",
-                                      study_idx=idx, study_status="done")
+                                      study_idx=idx, study_status="done", study_result=sr)
                             result.studies[idx] = sr
                             async with _cp_lock:
                                 _checkpoint(result, "studies_partial")
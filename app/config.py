@@ -36,6 +36,8 @@ class Settings:
     deep_max_studies: int = 6
     deep_max_rounds: int = 3
     deep_max_concurrent_studies: int = 3
+    elevenlabs_max_concurrency: int = 6
+    max_concurrent_jobs: int = 4
     gcs_results_bucket: str = ""
     openai_api_key: str = ""
     grok_api_key: str = ""
@@ -53,6 +55,8 @@ class Settings:
         self.deep_max_studies = int(os.getenv("DEEP_MAX_STUDIES", "6"))
         self.deep_max_rounds = int(os.getenv("DEEP_MAX_ROUNDS", "3"))
         self.deep_max_concurrent_studies = int(os.getenv("DEEP_MAX_CONCURRENT_STUDIES", "3"))
+        self.elevenlabs_max_concurrency = int(os.getenv("ELEVENLABS_MAX_CONCURRENCY", "6"))
+        self.max_concurrent_jobs = int(os.getenv("MAX_CONCURRENT_JOBS", "4"))
         self.google_api_key = os.getenv("GOOGLE_API_KEY", "")
         self.gcs_results_bucket = os.getenv("GCS_RESULTS_BUCKET", "")
 
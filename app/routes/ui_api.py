@@ -746,21 +746,17 @@ def generate_podcast():
                     if pj:
                         pj["phase"] = f"Generating audio... ({current}/{total} turns)"
 
-            audio_bytes = podcast_service.create_podcast(
+            # Audio is streamed to GCS as turns complete (falls back to a
+            # one-shot upload if streaming fails)
+            _, audio_url = podcast_service.create_and_upload_podcast(
                 script=script,
                 speaker_voices=speaker_voices,
                 api_key=api_key,
+                job_id=job_id,
+                bucket_name=bucket,
                 on_progress=_on_progress,
                 language_code=language,
             )
-
-            # Phase 3: Upload to GCS
-            with _podcast_lock:
-                pj = _podcast_jobs.get(podcast_job_id)
-                if pj:
-                    pj["phase"] = "Uploading audio..."
-
-            audio_url = podcast_service.upload_podcast_audio(audio_bytes, job_id, bucket)
             if not audio_url:
                 raise RuntimeError("Failed to upload podcast audio to storage")
 
@@ -951,16 +947,17 @@ def check_watch_endpoint(watch_id: str):
 
     try:
         from app.agents.watch_checker import check_watch
-        findings = asyncio.run(check_watch(watch.query))
-        update = watch_store.record_check(watch, findings, settings.gcs_results_bucket)
+        with asyncio.Runner() as runner:
+            findings = runner.run(check_watch(watch.query))
+            update = watch_store.record_check(watch, findings, settings.gcs_results_bucket)
 
-        # Send notification if changes detected
-        if update.changed and (watch.notification_email or watch.notification_webhook):
-            try:
-                from app.services.notification_client import send_watch_notification
-                asyncio.run(send_watch_notification(watch, update))
-            except Exception:
-                logger.warning("Notification failed for watch %s (non-fatal)", watch_id)
+            # Send notification if changes detected
+            if update.changed and (watch.notification_email or watch.notification_webhook):
+                try:
+                    from app.services.notification_client import send_watch_notification
+                    runner.run(send_watch_notification(watch, update))
+                except Exception:
+                    logger.warning("Notification failed for watch %s (non-fatal)", watch_id)
 
         return jsonify({
             "checked_at": update.checked_at,
@@ -992,27 +989,29 @@ def check_all_watches_endpoint():
         return jsonify({"checked": 0, "message": "No watches due"})
 
     results = []
-    for watch in due:
-        try:
-            from app.agents.watch_checker import check_watch
-            findings = asyncio.run(check_watch(watch.query))
-            update = watch_store.record_check(watch, findings, settings.gcs_results_bucket)
-
-            # Send notification if changes detected
-            if update.changed and (watch.notification_email or watch.notification_webhook):
-                try:
-                    from app.services.notification_client import send_watch_notification
-                    asyncio.run(send_watch_notification(watch, update))
-                except Exception:
-                    logger.warning("Notification failed for watch %s (non-fatal)", watch.id)
-
-            results.append({
-                "watch_id": watch.id,
-                "query": watch.query,
-                "changed": update.changed,
-            })
-        except Exception as e:
-            logger.exception("Watch check failed for %s", watch.id)
-            results.append({"watch_id": watch.id, "error": str(e)})
+    # One event loop shared by every check + notification in this request
+    with asyncio.Runner() as runner:
+        for watch in due:
+            try:
+                from app.agents.watch_checker import check_watch
+                findings = runner.run(check_watch(watch.query))
+                update = watch_store.record_check(watch, findings, settings.gcs_results_bucket)
+
+                # Send notification if changes detected
+                if update.changed and (watch.notification_email or watch.notification_webhook):
+                    try:
+                        from app.services.notification_client import send_watch_notification
+                        runner.run(send_watch_notification(watch, update))
+                    except Exception:
+                        logger.warning("Notification failed for watch %s (non-fatal)", watch.id)
+
+                results.append({
+                    "watch_id": watch.id,
+                    "query": watch.query,
+                    "changed": update.changed,
+                })
+            except Exception as e:
+                logger.exception("Watch check failed for %s", watch.id)
+                results.append({"watch_id": watch.id, "error": str(e)})
 
     return jsonify({"checked": len(results), "results": results})
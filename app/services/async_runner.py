@@ -0,0 +1,25 @@
+"""Event loops for research jobs.
+
+new_runner() gives each job thread its own loop (uvloop when available).
+"""
+
+import asyncio
+
+
+def _new_loop() -> asyncio.AbstractEventLoop:
+    """Create the loop: uvloop when installed (not on Windows), else stock asyncio."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def new_runner() -> asyncio.Runner:
+    """Return an event loop runner for one job, to use from that job's thread.
+
+    Each job gets its own loop so a blocking call inside one job's coroutines
+    (sync agent tools, GCS checkpoints) never stalls another job.
+    """
+    return asyncio.Runner(loop_factory=_new_loop)
+
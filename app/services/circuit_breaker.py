@@ -0,0 +1,99 @@
+"""Thread-safe circuit breaker for calls to flaky upstream APIs.
+
+After ``fail_threshold`` consecutive failures the circuit opens and calls fail
+fast with CircuitOpenError. Once ``reset_timeout`` seconds have passed a single
+trial call is let through (half-open): success closes the circuit, failure
+re-opens it for another ``reset_timeout``.
+"""
+
+import functools
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the upstream while its circuit is open (do not retry)."""
+
+
+class CircuitBreaker:
+    """Counts consecutive failures of the wrapped calls and short-circuits when open.
+
+    Only exceptions for which ``is_failure(exc)`` is true count as failures;
+    anything else (e.g. a 4xx for a bad request) passes through without
+    tripping the circuit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fail_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        is_failure=lambda exc: True,
+    ):
+        self.name = name
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self.is_failure = is_failure
+        self._failures = 0
+        self._opened_at = 0.0  # monotonic time the circuit opened; 0 while closed
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def _before_call(self) -> None:
+        with self._lock:
+            if not self._opened_at:
+                return
+            remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._trial_running:
+                raise CircuitOpenError(
+                    f"{self.name} circuit open after {self._failures} consecutive failures"
+                    + (f"; retry in {remaining:.0f}s" if remaining > 0 else "")
+                )
+            self._trial_running = True  # half-open: let this one call through
+
+    def _on_success(self) -> None:
+        with self._lock:
+            if self._opened_at:
+                logger.info("%s circuit closed", self.name)
+            self._failures = 0
+            self._opened_at = 0.0
+            self._trial_running = False
+
+    def _on_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._opened_at or self._failures >= self.fail_threshold:
+                self._opened_at = time.monotonic()
+                logger.warning(
+                    "%s circuit open for %ds after %d consecutive failures",
+                    self.name, self.reset_timeout, self._failures,
+                )
+
+    def call(self, func, *args, **kwargs):
+        """Call ``func`` through the breaker."""
+        self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            if isinstance(e, Exception) and self.is_failure(e):
+                self._on_failure()
+            else:
+                # Not an upstream failure; release a half-open trial without judging it
+                with self._lock:
+                    self._trial_running = False
+            raise
+        self._on_success()
+        return result
+
+    def __call__(self, func):
+        """Use the breaker as a decorator."""
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+
+        return wrapper
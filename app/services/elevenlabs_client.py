@@ -1,9 +1,15 @@
+import asyncio
 import io
 import logging
+import secrets
+import threading
 import time
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from app.services.circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +20,63 @@ class RagIndexNotReadyError(Exception):
     """Raised when ElevenLabs rejects an operation because RAG indexing is in progress."""
 
 
+# Statuses that signal a transient upstream condition worth retrying
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class KBServerError(Exception):
+    """Raised when the ElevenLabs API answers with a TRANSIENT_STATUSES code (safe to retry)."""
+
+    def __init__(self, status: int, message: str = ""):
+        super().__init__(f"ElevenLabs server error {status}: {message}")
+        self.status = status
+
+
+def _is_upstream_failure(exc: Exception) -> bool:
+    """True for errors that mean ElevenLabs itself is struggling (counted by the breaker)."""
+    if isinstance(exc, (KBServerError, requests.ConnectionError, requests.Timeout)):
+        return True
+    return (
+        isinstance(exc, requests.HTTPError)
+        and exc.response is not None
+        and exc.response.status_code in TRANSIENT_STATUSES
+    )
+
+
+# Shared by uploads and attaches: during an outage, fail fast with
+# CircuitOpenError instead of piling retries onto the recovering API.
+_breaker = CircuitBreaker("ElevenLabs", fail_threshold=5, reset_timeout=60, is_failure=_is_upstream_failure)
+
+
+# Connection pool for the shared session: concurrent uploads/attaches all hit
+# the same host, so the per-host pool must cover the orchestrator's fan-out.
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the shared keep-alive session, created on first use.
+
+    Reusing one session across calls (and jobs) skips the TCP + TLS handshake
+    on every request to the ElevenLabs API.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Retries are handled by callers (see _upload_with_retry)
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=0,
+                )
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
 def _headers(api_key: str) -> dict:
     return {
         "xi-api-key": api_key,
@@ -21,10 +84,11 @@ def _headers(api_key: str) -> dict:
     }
 
 
-def get_conversation(conversation_id: str, api_key: str) -> dict:
+def get_conversation(conversation_id: str, api_key: str, session: Optional[requests.Session] = None) -> dict:
     """Fetch full conversation data from ElevenLabs."""
+    http = session or _get_session()
     url = f"{BASE_URL}/convai/conversations/{conversation_id}"
-    resp = requests.get(url, headers=_headers(api_key), timeout=30)
+    resp = http.get(url, headers=_headers(api_key), timeout=30)
     resp.raise_for_status()
     return resp.json()
 
@@ -40,30 +104,86 @@ def format_conversation_context(data: dict) -> str:
     return "\n".join(lines)
 
 
-def upload_to_knowledge_base(text: str, name: str, api_key: str) -> str:
+# Docs above this many characters are uploaded as a streamed multipart body
+STREAM_UPLOAD_THRESHOLD = 1_048_576
+_STREAM_CHUNK_CHARS = 65_536
+
+
+def _iter_multipart(filename: str, text: str, boundary: str):
+    """Yield a single-file multipart/form-data body, encoding the text chunk by chunk."""
+    safe_name = filename.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+    yield (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{safe_name}"\r\n'
+        "Content-Type: text/markdown\r\n\r\n"
+    ).encode("utf-8")
+    for i in range(0, len(text), _STREAM_CHUNK_CHARS):
+        yield text[i:i + _STREAM_CHUNK_CHARS].encode("utf-8")
+    yield f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+
+@_breaker
+def upload_to_knowledge_base(
+    text: str, name: str, api_key: str, session: Optional[requests.Session] = None,
+) -> str:
     """Upload markdown as a .md file to ElevenLabs Knowledge Base. Returns document ID."""
+    http = session or _get_session()
     url = f"{BASE_URL}/convai/knowledge-base"
     # Ensure name ends with .md for ElevenLabs to process as markdown
     filename = name if name.endswith(".md") else f"{name}.md"
-    md_bytes = text.encode("utf-8")
-    files = {"file": (filename, io.BytesIO(md_bytes), "text/markdown")}
-    # Use multipart form data — no Content-Type header (requests sets boundary)
     headers = {"xi-api-key": api_key}
-    resp = requests.post(url, headers=headers, files=files, timeout=60)
-    resp.raise_for_status()
+    if len(text) > STREAM_UPLOAD_THRESHOLD:
+        # Large doc: stream the multipart body (chunked) instead of building it in memory
+        boundary = secrets.token_hex(16)
+        headers["Content-Type"] = f"multipart/form-data; boundary={boundary}"
+        resp = http.post(url, headers=headers, data=_iter_multipart(filename, text, boundary), timeout=60)
+    else:
+        md_bytes = text.encode("utf-8")
+        files = {"file": (filename, io.BytesIO(md_bytes), "text/markdown")}
+        # Use multipart form data — no Content-Type header (requests sets boundary)
+        resp = http.post(url, headers=headers, files=files, timeout=60)
+    if resp.status_code in TRANSIENT_STATUSES:
+        raise KBServerError(resp.status_code, resp.text[:200])
+    resp.raise_for_status()  # any other 4xx/5xx is permanent: HTTPError, not retried
     result = resp.json()
     doc_id = result.get("id", result.get("document_id", ""))
     logger.info("Uploaded KB document (md): %s (id=%s)", name, doc_id)
     return doc_id
 
 
-def attach_document_to_agent(agent_id: str, doc_id: str, doc_name: str, api_key: str) -> None:
+async def upload_to_knowledge_base_async(text: str, name: str, api_key: str) -> str:
+    """Async wrapper around upload_to_knowledge_base (runs in the default executor)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, lambda: upload_to_knowledge_base(text, name, api_key)
+    )
+
+
+
+def delete_knowledge_base_document(
+    doc_id: str, api_key: str, session: Optional[requests.Session] = None,
+) -> None:
+    """Delete a document from the ElevenLabs Knowledge Base (already gone is fine)."""
+    http = session or _get_session()
+    url = f"{BASE_URL}/convai/knowledge-base/{doc_id}"
+    resp = http.delete(url, headers={"xi-api-key": api_key}, timeout=30)
+    if resp.status_code == 404:
+        return
+    resp.raise_for_status()
+    logger.info("Deleted KB document %s", doc_id)
+
+
+@_breaker
+def attach_document_to_agent(
+    agent_id: str, doc_id: str, doc_name: str, api_key: str, session: Optional[requests.Session] = None,
+) -> None:
     """Attach a KB document to an agent using GET-then-PATCH to preserve existing docs."""
+    http = session or _get_session()
     headers = _headers(api_key)
 
     # GET current agent config
     get_url = f"{BASE_URL}/convai/agents/{agent_id}"
-    resp = requests.get(get_url, headers=headers, timeout=30)
+    resp = http.get(get_url, headers=headers, timeout=30)
     resp.raise_for_status()
     agent_config = resp.json()
 
@@ -104,19 +224,19 @@ def attach_document_to_agent(agent_id: str, doc_id: str, doc_name: str, api_key:
         "Patching agent %s KB: adding doc %s (type=%s), total KB entries: %d",
         agent_id, doc_id, doc_type, len(existing_kb),
     )
-    resp = requests.patch(patch_url, headers=headers, json=patch_payload, timeout=30)
+    resp = http.patch(patch_url, headers=headers, json=patch_payload, timeout=30)
     if resp.status_code == 422 and "rag_index_not_ready" in resp.text:
         # Auto-fix: trigger both RAG index models and retry
         logger.warning(
             "RAG index not ready for doc %s on agent %s — triggering indexes and polling",
             doc_id, agent_id,
         )
-        trigger_all_rag_indexes(doc_id, api_key)
+        trigger_all_rag_indexes(doc_id, api_key, session=http)
         # Wait up to 180s for indexes to complete (36 × 5s)
         indexes_ready = False
         for attempt in range(36):
             time.sleep(5)
-            idx_resp = requests.get(
+            idx_resp = http.get(
                 f"{BASE_URL}/convai/knowledge-base/{doc_id}/rag-index",
                 headers=headers, timeout=30,
             )
@@ -135,7 +255,7 @@ def attach_document_to_agent(agent_id: str, doc_id: str, doc_name: str, api_key:
         if not indexes_ready:
             logger.warning("RAG indexes still not ready after 180s for doc %s", doc_id)
         # Retry the PATCH
-        resp = requests.patch(patch_url, headers=headers, json=patch_payload, timeout=30)
+        resp = http.patch(patch_url, headers=headers, json=patch_payload, timeout=30)
 
     if not resp.ok:
         body = resp.text[:500]
@@ -150,7 +270,7 @@ def attach_document_to_agent(agent_id: str, doc_id: str, doc_name: str, api_key:
             )
     resp.raise_for_status()
     # Verify the doc was actually added
-    verify_resp = requests.get(get_url, headers=headers, timeout=30)
+    verify_resp = http.get(get_url, headers=headers, timeout=30)
     if verify_resp.ok:
         verify_kb = (
             verify_resp.json()
@@ -173,10 +293,13 @@ def attach_document_to_agent(agent_id: str, doc_id: str, doc_name: str, api_key:
         logger.warning("Could not verify attachment (GET returned %s)", verify_resp.status_code)
 
 
-def list_agent_knowledge_base(agent_id: str, api_key: str) -> list[dict]:
+def list_agent_knowledge_base(
+    agent_id: str, api_key: str, session: Optional[requests.Session] = None,
+) -> list[dict]:
     """Return the knowledge_base array from an agent's config."""
+    http = session or _get_session()
     url = f"{BASE_URL}/convai/agents/{agent_id}"
-    resp = requests.get(url, headers=_headers(api_key), timeout=30)
+    resp = http.get(url, headers=_headers(api_key), timeout=30)
     resp.raise_for_status()
     agent_config = resp.json()
     kb = (
@@ -196,12 +319,15 @@ def list_agent_knowledge_base(agent_id: str, api_key: str) -> list[dict]:
     return kb
 
 
-def detach_document_from_agent(agent_id: str, doc_id: str, api_key: str) -> None:
+def detach_document_from_agent(
+    agent_id: str, doc_id: str, api_key: str, session: Optional[requests.Session] = None,
+) -> None:
     """Remove a KB document from an agent (GET current list, filter, PATCH back)."""
+    http = session or _get_session()
     headers = _headers(api_key)
     url = f"{BASE_URL}/convai/agents/{agent_id}"
 
-    resp = requests.get(url, headers=headers, timeout=30)
+    resp = http.get(url, headers=headers, timeout=30)
     resp.raise_for_status()
     agent_config = resp.json()
 
@@ -227,26 +353,31 @@ def detach_document_from_agent(agent_id: str, doc_id: str, api_key: str) -> None
             }
         }
     }
-    resp = requests.patch(url, headers=headers, json=patch_payload, timeout=30)
+    resp = http.patch(url, headers=headers, json=patch_payload, timeout=30)
     resp.raise_for_status()
     logger.info("Detached document %s from agent %s", doc_id, agent_id)
 
 
-def attach_documents_to_agent(agent_id: str, doc_map: dict[str, str], api_key: str) -> None:
+@_breaker
+def attach_documents_to_agent(
+    agent_id: str, doc_map: dict[str, str], api_key: str, session: Optional[requests.Session] = None,
+) -> None:
     """Attach multiple KB documents to an agent in a single GET + PATCH.
 
     Args:
         agent_id: ElevenLabs agent ID.
         doc_map: Mapping of document ID to document name.
         api_key: ElevenLabs API key.
+        session: HTTP session to use; defaults to the shared module session.
     """
+    http = session or _get_session()
     if not doc_map:
         return
 
     headers = _headers(api_key)
 
     get_url = f"{BASE_URL}/convai/agents/{agent_id}"
-    resp = requests.get(get_url, headers=headers, timeout=30)
+    resp = http.get(get_url, headers=headers, timeout=30)
     resp.raise_for_status()
     agent_config = resp.json()
 
@@ -282,7 +413,7 @@ def attach_documents_to_agent(agent_id: str, doc_map: dict[str, str], api_key: s
             }
         }
     }
-    resp = requests.patch(patch_url, headers=headers, json=patch_payload, timeout=30)
+    resp = http.patch(patch_url, headers=headers, json=patch_payload, timeout=30)
 
     if resp.status_code == 422 and "rag_index_not_ready" in resp.text:
         logger.warning(
@@ -290,13 +421,13 @@ def attach_documents_to_agent(agent_id: str, doc_map: dict[str, str], api_key: s
             agent_id, len(new_docs),
         )
         for doc in new_docs:
-            trigger_all_rag_indexes(doc["id"], api_key)
+            trigger_all_rag_indexes(doc["id"], api_key, session=http)
         # Poll all docs for up to 180s
         for attempt in range(36):
             time.sleep(5)
             all_ready = True
             for doc in new_docs:
-                idx_resp = requests.get(
+                idx_resp = http.get(
                     f"{BASE_URL}/convai/knowledge-base/{doc['id']}/rag-index",
                     headers=headers, timeout=30,
                 )
@@ -313,7 +444,7 @@ def attach_documents_to_agent(agent_id: str, doc_map: dict[str, str], api_key: s
                 break
             if attempt % 6 == 0:
                 logger.info("RAG index batch poll %d/36 — still waiting", attempt + 1)
-        resp = requests.patch(patch_url, headers=headers, json=patch_payload, timeout=30)
+        resp = http.patch(patch_url, headers=headers, json=patch_payload, timeout=30)
 
     if resp.status_code == 422 and "rag_index_not_ready" in resp.text:
         raise RagIndexNotReadyError(
@@ -322,35 +453,92 @@ def attach_documents_to_agent(agent_id: str, doc_map: dict[str, str], api_key: s
     resp.raise_for_status()
     logger.info("Attached %d new documents to agent %s (total KB: %d)", len(new_docs), agent_id, len(existing_kb))
 
+    # Verify the docs were actually added
+    verify_resp = http.get(get_url, headers=headers, timeout=30)
+    if verify_resp.ok:
+        verify_kb = (
+            verify_resp.json()
+            .get("conversation_config", {})
+            .get("agent", {})
+            .get("prompt", {})
+            .get("knowledge_base", [])
+        )
+        verify_ids = {d.get("id", d.get("document_id", "")) for d in verify_kb}
+        missing = [doc["id"] for doc in new_docs if doc["id"] not in verify_ids]
+        if missing:
+            logger.error(
+                "ATTACH FAILED SILENTLY: docs %s not found in agent %s KB after PATCH. "
+                "KB types: %s",
+                missing, agent_id,
+                [d.get("type") for d in verify_kb],
+            )
+        else:
+            logger.info("Verified: %d documents attached to agent %s (KB size: %d)", len(new_docs), agent_id, len(verify_kb))
+    else:
+        logger.warning("Could not verify attachment (GET returned %s)", verify_resp.status_code)
+
+
+async def attach_documents_to_agent_async(agent_id: str, doc_map: dict[str, str], api_key: str) -> None:
+    """Async wrapper around attach_documents_to_agent (runs in the default executor)."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        None, lambda: attach_documents_to_agent(agent_id, doc_map, api_key)
+    )
+
 
 _RAG_MODELS = ["multilingual_e5_large_instruct", "e5_mistral_7b_instruct"]
 
 
-def trigger_rag_index(doc_id: str, api_key: str, model: str = "multilingual_e5_large_instruct") -> dict:
+def trigger_rag_index(
+    doc_id: str,
+    api_key: str,
+    model: str = "multilingual_e5_large_instruct",
+    session: Optional[requests.Session] = None,
+) -> dict:
     """Trigger RAG indexing for a KB document. Returns index status.
 
     If already indexed, returns current status without re-indexing.
     """
+    http = session or _get_session()
     url = f"{BASE_URL}/convai/knowledge-base/{doc_id}/rag-index"
-    resp = requests.post(url, headers=_headers(api_key), json={"model": model}, timeout=30)
+    resp = http.post(url, headers=_headers(api_key), json={"model": model}, timeout=30)
     resp.raise_for_status()
     result = resp.json()
     logger.info("RAG index for doc %s: status=%s", doc_id, result.get("status", "unknown"))
     return result
 
 
-def trigger_all_rag_indexes(doc_id: str, api_key: str) -> list[dict]:
+def trigger_all_rag_indexes(
+    doc_id: str, api_key: str, session: Optional[requests.Session] = None,
+) -> list[dict]:
     """Trigger both RAG index models required for agent attachment.
 
     ElevenLabs requires both multilingual_e5_large_instruct AND
     e5_mistral_7b_instruct indexes to be ready before a doc can be
     attached to an agent via PATCH.
     """
+    http = session or _get_session()
     results = []
     for model in _RAG_MODELS:
         try:
-            r = trigger_rag_index(doc_id, api_key, model=model)
+            r = trigger_rag_index(doc_id, api_key, model=model, session=http)
             results.append(r)
         except Exception:
             logger.exception("Failed to trigger RAG index model %s for doc %s", model, doc_id)
     return results
+
+
+async def trigger_all_rag_indexes_async(doc_id: str, api_key: str) -> list[dict]:
+    """Async trigger_all_rag_indexes: both models are requested concurrently (in the default executor)."""
+    loop = asyncio.get_running_loop()
+    responses = await asyncio.gather(*(
+        loop.run_in_executor(None, lambda m=model: trigger_rag_index(doc_id, api_key, model=m))
+        for model in _RAG_MODELS
+    ), return_exceptions=True)
+    results = []
+    for model, r in zip(_RAG_MODELS, responses):
+        if isinstance(r, Exception):
+            logger.error("Failed to trigger RAG index model %s for doc %s", model, doc_id, exc_info=r)
+        else:
+            results.append(r)
+    return results
@@ -356,9 +356,57 @@ def publish_results_with_metadata(
         "research_stats": research_stats or {},
     }
     upload_metadata(metadata, job_id, bucket_name)
+    upload_result_json(result, query, depth, job_id, bucket_name)
     return result_url
 
 
+def upload_result_json(
+    result: ResearchResult, query: str, depth: str, job_id: str, bucket_name: str,
+) -> None:
+    """Write the raw synthesis text to GCS at results/{job_id}_result.json.
+
+    Lets amendments reuse the original synthesis without scraping the HTML page.
+    """
+    if not bucket_name:
+        return
+    payload = {
+        "job_id": job_id,
+        "query": query,
+        "depth": depth.upper(),
+        "final_synthesis": result.final_synthesis,
+        "master_synthesis": result.master_synthesis,
+        "strategic_analysis": result.strategic_analysis,
+        "qa_summary": result.qa_summary,
+    }
+    try:
+        from google.cloud import storage
+
+        client = storage.Client()
+        bucket = client.bucket(bucket_name)
+        blob = bucket.blob(f"results/{job_id}_result.json")
+        blob.upload_from_string(json.dumps(payload), content_type="application/json")
+    except Exception:
+        logger.exception("Failed to upload result JSON for job %s", job_id)
+
+
+def get_result_json(job_id: str, bucket_name: str) -> dict | None:
+    """Fetch the raw synthesis JSON written by upload_result_json, if present."""
+    if not bucket_name:
+        return None
+    try:
+        from google.cloud import storage
+
+        client = storage.Client()
+        bucket = client.bucket(bucket_name)
+        blob = bucket.blob(f"results/{job_id}_result.json")
+        if not blob.exists():
+            return None
+        return json.loads(blob.download_as_text())
+    except Exception:
+        logger.exception("Failed to fetch result JSON for job %s", job_id)
+        return None
+
+
 def _slugify(text: str, max_len: int = 60) -> str:
     """Convert text to a URL-friendly slug."""
     slug = re.sub(r"[^a-z0-9]+", "-", text.lower().strip())
@@ -479,7 +527,7 @@ def publish_notebooklm_sources(
 
 
 def delete_result(job_id: str, bucket_name: str) -> bool:
-    """Delete HTML + metadata JSON from GCS. Returns True if anything was deleted."""
+    """Delete HTML + metadata/result JSON from GCS. Returns True if anything was deleted."""
     if not bucket_name:
         return False
     try:
@@ -488,7 +536,7 @@ def delete_result(job_id: str, bucket_name: str) -> bool:
         client = storage.Client()
         bucket = client.bucket(bucket_name)
         deleted = False
-        for suffix in [".html", "_meta.json", "_checkpoint.json"]:
+        for suffix in [".html", "_meta.json", "_result.json", "_checkpoint.json"]:
             blob = bucket.blob(f"results/{job_id}{suffix}")
             if blob.exists():
                 blob.delete()
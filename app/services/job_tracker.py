@@ -78,6 +78,88 @@ def update_job(job_id: str, **kwargs) -> None:
                 setattr(job, key, value)
 
 
+# Minimum spacing between coalesced progress writes (seconds)
+PROGRESS_FLUSH_INTERVAL = 0.5
+
+
+class ProgressDebouncer:
+    """Coalesce rapid update_job() calls coming from a pipeline progress callback.
+
+    A new study plan or progress list, or a new ``current_step``, is written
+    immediately so per-study status changes always land on the current list.
+    Other updates (mostly phase text) are merged and written at most once per
+    ``interval`` by a trailing timer, so the latest values always land. Call
+    flush() once the pipeline returns, before other code updates the job directly.
+    """
+
+    _IMMEDIATE_KEYS = ("study_plan", "study_progress")
+
+    def __init__(self, job_id: str, interval: float = PROGRESS_FLUSH_INTERVAL):
+        self.job_id = job_id
+        self.interval = interval
+        self._pending: dict = {}
+        self._last_step = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def push(self, **updates) -> None:
+        """Queue updates for the job, writing straight through on a new plan or step."""
+        with self._lock:
+            self._pending.update(updates)
+            step = updates.get("current_step", self._last_step)
+            if step != self._last_step or any(k in updates for k in self._IMMEDIATE_KEYS):
+                self._last_step = step
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.interval, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def set_study_status(self, idx: int, status: str) -> None:
+        """Set one study's status on the newest progress list (pending or written)."""
+        with self._lock:
+            study_progress = self._pending.get("study_progress")
+            if study_progress is None:
+                job = get_job(self.job_id)
+                study_progress = job.study_progress if job else []
+            if 0 <= idx < len(study_progress):
+                study_progress[idx]["status"] = status
+
+    def flush(self) -> None:
+        """Write any pending updates now, stopping the trailing timer first.
+
+        Waits for a timer write that is already running, so no update from this
+        debouncer can land after flush() returns.
+        """
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+            if timer is not threading.current_thread():
+                timer.join()
+        with self._lock:
+            self._flush_locked()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            # A flush or immediate write since this timer started owns the pending updates
+            if self._timer is not threading.current_thread():
+                return
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        # The pending dict is swapped and the timer cleared under the same
+        # lock push() takes, so a concurrent push either lands in this write
+        # or starts a fresh timer
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        updates, self._pending = self._pending, {}
+        update_job(self.job_id, **updates)
+
+
 def record_phase_timing(job_id: str, phase_key: str) -> None:
     """Record that a new pipeline phase has started.
 
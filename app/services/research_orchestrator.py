@@ -1,24 +1,56 @@
 import asyncio
+import io
 import logging
+import random
+import re
 import threading
 import time
 from datetime import datetime, timezone
 
+import httpx
+import requests
+
 from app.agents.agent_profiles import AGENTS, get_agent_id
+from app.agents.entity_extractor import extract_entities
+from app.agents.memory_extractor import extract_memories
 from app.config import Settings
 from app.models.depth import ResearchDepth
-from app.services import elevenlabs_client, gcs_client
+from app.services import async_runner, elevenlabs_client, gcs_client, memory_store
+from app.services import knowledge_graph as kg
 from app.services.job_tracker import (
-    JobStatus, get_job, update_job, record_phase_timing, finalize_timings,
-    recreate_job,
+    JobStatus, ProgressDebouncer, update_job, record_phase_timing,
+    finalize_timings, recreate_job,
 )
-from app.services.research_stats import init_stats, get_stats, compute_human_hours
+from app.services.research_stats import init_stats, get_stats, flush_stats, compute_human_hours
 from app.agents.root_agent import execute_research
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 2
+MAX_DELAY = 30
+
+# Per-study progress steps are folded into one phase timing bucket
+_TIMING_PREFIX_RE = re.compile(r"(study_|gap_study_)")
+_TIMING_PREFIX_KEYS = {"study_": "studies", "gap_study_": "refinement"}
+
+# HTML-to-text for the amendment fallback path (bytes: skips decoding markup)
+_TAG_RE = re.compile(rb"<[^>]+>")
+_WS_RE = re.compile(rb"\s+")
+
+
+_UTC = timezone.utc
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO-8601 string (millisecond precision)."""
+    return datetime.now(_UTC).isoformat(timespec="milliseconds")
+
+
+def _timing_key(step: str) -> str:
+    """Map a progress step to its phase timing key."""
+    m = _TIMING_PREFIX_RE.match(step)
+    return _TIMING_PREFIX_KEYS[m.group(1)] if m else step
 
 
 def run_research_pipeline(
@@ -54,14 +86,18 @@ def run_research_pipeline(
                 exc_info=True,
             )
 
-        # 2. Execute ADK research pipeline
-        result = asyncio.run(execute_research(query=user_query, context=context, depth=depth))
-
-        # 3. Upload and attach based on depth
-        if depth == ResearchDepth.DEEP:
-            _handle_deep_upload(result, user_query, conversation_id, agent_id, settings)
-        else:
-            _handle_standard_upload(result, user_query, conversation_id, agent_id, settings)
+        # One event loop for the whole job: research, uploads and attaches
+        with async_runner.new_runner() as runner:
+            # 2. Execute ADK research pipeline, then
+            # 3. upload and attach based on depth
+            if depth == ResearchDepth.DEEP:
+                result, study_uploads = runner.run(_research_uploading_studies(
+                    user_query, context, _deep_name_suffix(user_query, conversation_id), settings,
+                ))
+                _handle_deep_upload(result, user_query, conversation_id, agent_id, settings, runner, study_uploads)
+            else:
+                result = runner.run(execute_research(query=user_query, context=context, depth=depth))
+                _handle_standard_upload(result, user_query, conversation_id, agent_id, settings, runner)
 
     except Exception:
         logger.exception(
@@ -69,7 +105,7 @@ def run_research_pipeline(
         )
 
 
-def _handle_standard_upload(result, user_query, conversation_id, agent_id, settings):
+def _handle_standard_upload(result, user_query, conversation_id, agent_id, settings, runner):
     """Upload single document for QUICK/STANDARD pipelines."""
     if not result.final_synthesis:
         logger.error("Research pipeline produced empty synthesis")
@@ -94,40 +130,35 @@ def _handle_standard_upload(result, user_query, conversation_id, agent_id, setti
         return
 
     # Attach to ALL agents, not just the triggering one
+    agents = _configured_agents(settings)
+    results = runner.run(_attach_concurrently(
+        elevenlabs_client.attach_documents_to_agent_async, agents,
+        doc_map={doc_id: doc_name}, api_key=settings.elevenlabs_api_key,
+        limit=settings.elevenlabs_max_concurrency,
+    ))
     failed_agents = []
-    for slug in AGENTS:
-        aid = get_agent_id(slug, settings)
-        if not aid:
-            continue
-        try:
-            elevenlabs_client.attach_document_to_agent(
-                agent_id=aid,
-                doc_id=doc_id,
-                doc_name=doc_name,
-                api_key=settings.elevenlabs_api_key,
-            )
+    for (slug, aid), err in zip(agents, results):
+        if err is None:
             logger.info("Attached doc %s to agent %s (%s)", doc_id, slug, aid)
-        except elevenlabs_client.RagIndexNotReadyError:
+        elif isinstance(err, elevenlabs_client.RagIndexNotReadyError):
             logger.warning("RAG index not ready for agent %s (%s) — will retry", slug, aid)
             failed_agents.append((slug, aid))
-        except Exception:
-            logger.exception("Failed to attach doc to agent %s", slug)
+        else:
+            logger.error("Failed to attach doc to agent %s", slug, exc_info=err)
 
     if failed_agents:
-        import time
         logger.info("Waiting 60s before retrying %d failed agent attaches", len(failed_agents))
         time.sleep(60)
-        for slug, aid in failed_agents:
-            try:
-                elevenlabs_client.attach_document_to_agent(
-                    agent_id=aid,
-                    doc_id=doc_id,
-                    doc_name=doc_name,
-                    api_key=settings.elevenlabs_api_key,
-                )
+        results = runner.run(_attach_concurrently(
+            elevenlabs_client.attach_documents_to_agent_async, failed_agents,
+            doc_map={doc_id: doc_name}, api_key=settings.elevenlabs_api_key,
+            limit=settings.elevenlabs_max_concurrency,
+        ))
+        for (slug, aid), err in zip(failed_agents, results):
+            if err is None:
                 logger.info("Retry succeeded: attached doc %s to agent %s (%s)", doc_id, slug, aid)
-            except Exception:
-                logger.exception("Retry also failed for agent %s (%s)", slug, aid)
+            else:
+                logger.error("Retry also failed for agent %s (%s)", slug, aid, exc_info=err)
 
     if settings.gcs_results_bucket:
         url = gcs_client.publish_results(
@@ -137,95 +168,151 @@ def _handle_standard_upload(result, user_query, conversation_id, agent_id, setti
             logger.info("Results page: %s", url)
 
 
-def _handle_deep_upload(result, user_query, conversation_id, agent_id, settings):
-    """Upload multiple documents for DEEP pipeline."""
+def _deep_name_suffix(user_query: str, conversation_id: str) -> str:
+    """Shared "<query> (<conversation>)" tail of every DEEP document name."""
+    return f"{user_query[:60]} ({conversation_id[:8]})"
+
+
+def _study_doc_name(title: str, name_suffix: str) -> str:
+    """KB document name for one DEEP study (same layout wherever it is uploaded)."""
+    return "Study: " + title[:60] + " - " + name_suffix
+
+
+async def _research_uploading_studies(user_query, context, name_suffix, settings):
+    """Run DEEP research, uploading each study to the KB as soon as it completes.
+
+    Returns (result, study_uploads) where study_uploads maps study index to
+    (doc_name, doc ID or the exception raised) for the uploads already done.
+    """
+    api_key = settings.elevenlabs_api_key
+    sem = asyncio.Semaphore(max(1, settings.elevenlabs_max_concurrency))
+    tasks = {}  # {study index: (doc_name, upload task)}
+
+    async def _upload(text, name):
+        async with sem:
+            return await _upload_with_retry_async(text=text, name=name, api_key=api_key)
+
+    def _on_progress(phase, **kwargs):
+        study = kwargs.get("study_result")
+        if study is not None and study.synthesis:
+            doc_name = _study_doc_name(study.title, name_suffix)
+            tasks[kwargs["study_idx"]] = (
+                doc_name, asyncio.get_running_loop().create_task(_upload(study.synthesis, doc_name)),
+            )
+
+    try:
+        result = await execute_research(
+            query=user_query, context=context, depth=ResearchDepth.DEEP, on_progress=_on_progress,
+        )
+    except BaseException:
+        # The studies uploaded so far will never be attached: don't leave them in the KB
+        doc_ids = await asyncio.gather(*(task for _, task in tasks.values()), return_exceptions=True)
+        await _delete_kb_docs([d for d in doc_ids if d and not isinstance(d, BaseException)], api_key)
+        raise
+    doc_ids = await asyncio.gather(*(task for _, task in tasks.values()), return_exceptions=True)
+    study_uploads = {
+        idx: (doc_name, doc_id) for (idx, (doc_name, _)), doc_id in zip(tasks.items(), doc_ids)
+    }
+    return result, study_uploads
+
+
+async def _delete_kb_docs(doc_ids, api_key):
+    """Delete KB docs that were uploaded for a job that failed before attaching them."""
+    if not doc_ids:
+        return
+    logger.warning("Deleting %d unattached KB docs: %s", len(doc_ids), doc_ids)
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*(
+        loop.run_in_executor(None, elevenlabs_client.delete_knowledge_base_document, doc_id, api_key)
+        for doc_id in doc_ids
+    ), return_exceptions=True)
+    for doc_id, err in zip(doc_ids, results):
+        if err is not None:
+            logger.error("Failed to delete unattached KB doc %s", doc_id, exc_info=err)
+
+
+def _handle_deep_upload(result, user_query, conversation_id, agent_id, settings, runner, study_uploads=None):
+    """Upload multiple documents for DEEP pipeline.
+
+    ``study_uploads`` holds studies already uploaded while research was still
+    running (see _research_uploading_studies); those are not uploaded again.
+    """
     all_docs = {}  # {doc_id: doc_name}
     api_key = settings.elevenlabs_api_key
-    query_short = user_query[:60]
-    conv_short = conversation_id[:8]
-
-    # Per-study documents
-    for study in result.studies:
-        if not study.synthesis:
-            continue
-        doc_name = f"Study: {study.title[:60]} - {query_short} ({conv_short})"
-        try:
-            doc_id = _upload_with_retry(text=study.synthesis, name=doc_name, api_key=api_key)
-            if doc_id:
+    study_uploads = study_uploads or {}
+    name_suffix = _deep_name_suffix(user_query, conversation_id)
+
+    # Collect the remaining documents up front, then upload them concurrently.
+    # Each entry: (text, doc_name, target object, doc-id attribute, log label)
+    uploads = []
+    for idx, study in enumerate(result.studies):
+        if idx in study_uploads:
+            doc_name, doc_id = study_uploads[idx]
+            if isinstance(doc_id, Exception):
+                logger.error("Failed to upload study: %s", study.title, exc_info=doc_id)
+            elif doc_id:
                 study.doc_id = doc_id
                 all_docs[doc_id] = doc_name
-        except Exception:
-            logger.exception("Failed to upload study: %s", study.title)
-
-    # Master synthesis
+        elif study.synthesis:
+            doc_name = _study_doc_name(study.title, name_suffix)
+            uploads.append((study.synthesis, doc_name, study, "doc_id", f"study: {study.title}"))
     if result.master_synthesis:
-        doc_name = f"Master Briefing: {query_short} ({conv_short})"
-        try:
-            doc_id = _upload_with_retry(text=result.master_synthesis, name=doc_name, api_key=api_key)
-            if doc_id:
-                result.master_doc_id = doc_id
-                all_docs[doc_id] = doc_name
-        except Exception:
-            logger.exception("Failed to upload master synthesis")
-
-    # Q&A cluster documents
+        doc_name = "Master Briefing: " + name_suffix
+        uploads.append((result.master_synthesis, doc_name, result, "master_doc_id", "master synthesis"))
     for cluster in result.qa_clusters:
-        if not cluster.findings:
-            continue
-        doc_name = f"Q&A: {cluster.theme[:60]} - {query_short} ({conv_short})"
-        try:
-            doc_id = _upload_with_retry(text=cluster.findings, name=doc_name, api_key=api_key)
-            if doc_id:
-                cluster.doc_id = doc_id
-                all_docs[doc_id] = doc_name
-        except Exception:
-            logger.exception("Failed to upload Q&A cluster: %s", cluster.theme)
-
-    # Q&A summary
+        if cluster.findings:
+            doc_name = "Q&A: " + cluster.theme[:60] + " - " + name_suffix
+            uploads.append((cluster.findings, doc_name, cluster, "doc_id", f"Q&A cluster: {cluster.theme}"))
     if result.qa_summary:
-        doc_name = f"Anticipated Q&A: {query_short} ({conv_short})"
-        try:
-            doc_id = _upload_with_retry(text=result.qa_summary, name=doc_name, api_key=api_key)
-            if doc_id:
-                result.qa_summary_doc_id = doc_id
-                all_docs[doc_id] = doc_name
-        except Exception:
-            logger.exception("Failed to upload Q&A summary")
+        doc_name = "Anticipated Q&A: " + name_suffix
+        uploads.append((result.qa_summary, doc_name, result, "qa_summary_doc_id", "Q&A summary"))
+
+    try:
+        doc_ids = runner.run(_upload_many_async(
+            [(text, name) for text, name, *_ in uploads], api_key, settings.elevenlabs_max_concurrency,
+        ))
+    except Exception:
+        # Nothing gets attached now: drop the studies uploaded during research
+        runner.run(_delete_kb_docs(list(all_docs), api_key))
+        raise
+    for (_, doc_name, target, attr, label), doc_id in zip(uploads, doc_ids):
+        if isinstance(doc_id, Exception):
+            logger.error("Failed to upload %s", label, exc_info=doc_id)
+        elif doc_id:
+            setattr(target, attr, doc_id)
+            all_docs[doc_id] = doc_name
 
     # Batch attach all documents to ALL agents
     if all_docs:
+        agents = _configured_agents(settings)
+        results = runner.run(_attach_concurrently(
+            elevenlabs_client.attach_documents_to_agent_async, agents,
+            doc_map=all_docs, api_key=api_key,
+            limit=settings.elevenlabs_max_concurrency,
+        ))
         failed_agents = []
-        for slug in AGENTS:
-            aid = get_agent_id(slug, settings)
-            if not aid:
-                continue
-            try:
-                elevenlabs_client.attach_documents_to_agent(
-                    agent_id=aid,
-                    doc_map=all_docs,
-                    api_key=api_key,
-                )
+        for (slug, aid), err in zip(agents, results):
+            if err is None:
                 logger.info("Attached %d docs to agent %s (%s)", len(all_docs), slug, aid)
-            except elevenlabs_client.RagIndexNotReadyError:
+            elif isinstance(err, elevenlabs_client.RagIndexNotReadyError):
                 logger.warning("RAG index not ready for batch attach to agent %s (%s) — will retry", slug, aid)
                 failed_agents.append((slug, aid))
-            except Exception:
-                logger.exception("Failed to batch attach documents to agent %s", slug)
+            else:
+                logger.error("Failed to batch attach documents to agent %s", slug, exc_info=err)
 
         if failed_agents:
-            import time
             logger.info("Waiting 60s before retrying %d failed batch attaches", len(failed_agents))
             time.sleep(60)
-            for slug, aid in failed_agents:
-                try:
-                    elevenlabs_client.attach_documents_to_agent(
-                        agent_id=aid,
-                        doc_map=all_docs,
-                        api_key=api_key,
-                    )
+            results = runner.run(_attach_concurrently(
+                elevenlabs_client.attach_documents_to_agent_async, failed_agents,
+                doc_map=all_docs, api_key=api_key,
+                limit=settings.elevenlabs_max_concurrency,
+            ))
+            for (slug, aid), err in zip(failed_agents, results):
+                if err is None:
                     logger.info("Retry succeeded: attached %d docs to agent %s (%s)", len(all_docs), slug, aid)
-                except Exception:
-                    logger.exception("Retry also failed for batch attach to agent %s (%s)", slug, aid)
+                else:
+                    logger.error("Retry also failed for batch attach to agent %s (%s)", slug, aid, exc_info=err)
 
     result.all_doc_ids = list(all_docs.keys())
     logger.info(
@@ -241,53 +328,95 @@ def _handle_deep_upload(result, user_query, conversation_id, agent_id, settings)
             logger.info("Results page: %s", url)
 
 
+def _iter_consolidated(result, query: str, depth: str):
+    """Yield the lines of the consolidated research document, section by section."""
+    yield f"Research Briefing: {query}"
+    yield f"Depth: {depth.upper()}"
+    yield ""
+
+    # QUICK/STANDARD: just the synthesis, none of the DEEP sections
+    if depth.upper() != "DEEP":
+        if result.final_synthesis:
+            yield result.final_synthesis
+        return
+
+    # Include quality scores if available
+    score = result.synthesis_score
+    if score > 0:
+        yield f"Synthesis Quality Score: {score:.1f}/10"
+        if result.synthesis_scores:
+            score_parts = ", ".join(f"{k}: {v}/10" for k, v in result.synthesis_scores.items())
+            yield f"Dimension Scores: {score_parts}"
+        if result.refinement_rounds > 0:
+            yield f"Refinement Rounds: {result.refinement_rounds}"
+        yield ""
+
+    if result.master_synthesis:
+        yield from ("=== EXECUTIVE SUMMARY ===", result.master_synthesis, "")
+
+    if result.strategic_analysis:
+        yield from ("=== STRATEGIC ANALYSIS ===", result.strategic_analysis, "")
+
+    for i, study in enumerate(result.studies or [], 1):
+        if study.synthesis:
+            yield from (f"=== STUDY {i}: {study.title} ===", study.synthesis, "")
+
+    for cluster in getattr(result, "qa_clusters", []):
+        if cluster.findings:
+            yield from (f"=== Q&A: {cluster.theme} ===", cluster.findings, "")
+
+    if result.qa_summary:
+        yield from ("=== ANTICIPATED Q&A SUMMARY ===", result.qa_summary, "")
+
+
 def _build_consolidated_text(result, query: str, depth: str) -> str:
     """Combine all research outputs into a single text document for KB upload."""
-    parts = [f"Research Briefing: {query}", f"Depth: {depth.upper()}", ""]
-
-    if depth.upper() == "DEEP":
-        # Include quality scores if available
-        if result.synthesis_score > 0:
-            parts.append(f"Synthesis Quality Score: {result.synthesis_score:.1f}/10")
-            if result.synthesis_scores:
-                score_parts = ", ".join(f"{k}: {v}/10" for k, v in result.synthesis_scores.items())
-                parts.append(f"Dimension Scores: {score_parts}")
-            if result.refinement_rounds > 0:
-                parts.append(f"Refinement Rounds: {result.refinement_rounds}")
-            parts.append("")
-
-        if result.master_synthesis:
-            parts.append("=== EXECUTIVE SUMMARY ===")
-            parts.append(result.master_synthesis)
-            parts.append("")
-
-        if result.strategic_analysis:
-            parts.append("=== STRATEGIC ANALYSIS ===")
-            parts.append(result.strategic_analysis)
-            parts.append("")
-
-        if result.studies:
-            for i, study in enumerate(result.studies, 1):
-                if study.synthesis:
-                    parts.append(f"=== STUDY {i}: {study.title} ===")
-                    parts.append(study.synthesis)
-                    parts.append("")
-
-        for cluster in getattr(result, "qa_clusters", []):
-            if cluster.findings:
-                parts.append(f"=== Q&A: {cluster.theme} ===")
-                parts.append(cluster.findings)
-                parts.append("")
-
-        if result.qa_summary:
-            parts.append("=== ANTICIPATED Q&A SUMMARY ===")
-            parts.append(result.qa_summary)
-            parts.append("")
-    else:
-        if result.final_synthesis:
-            parts.append(result.final_synthesis)
+    # Write straight into one buffer; str.join would first collect the lines into a list
+    buf = io.StringIO()
+    write = buf.write
+    lines = _iter_consolidated(result, query, depth)
+    write(next(lines))  # the header line is always present
+    for line in lines:
+        write("\n")
+        write(line)
+    return buf.getvalue()
+
+
+# Caps UI research jobs running at once (each holds a thread, an event loop and
+# its HTTP clients). Created lazily, sized from settings.max_concurrent_jobs.
+_job_slots: threading.BoundedSemaphore | None = None
+_job_slots_lock = threading.Lock()
 
-    return "\n".join(parts)
+
+def _get_job_slots(settings: Settings) -> threading.BoundedSemaphore:
+    global _job_slots
+    if _job_slots is None:
+        with _job_slots_lock:
+            if _job_slots is None:
+                _job_slots = threading.BoundedSemaphore(max(1, settings.max_concurrent_jobs))
+    return _job_slots
+
+
+def _start_job_thread(job_id: str, make_coro, settings: Settings) -> None:
+    """Run the coroutine from ``make_coro()`` on its own event loop in a daemon thread.
+
+    The thread waits for one of the job slots first, so at most
+    ``settings.max_concurrent_jobs`` UI jobs run at once; the rest queue.
+    """
+    slots = _get_job_slots(settings)
+
+    def _target():
+        if not slots.acquire(blocking=False):
+            update_job(job_id, phase="Queued: waiting for a free research slot")
+            slots.acquire()
+        try:
+            with async_runner.new_runner() as runner:
+                runner.run(make_coro())
+        finally:
+            slots.release()
+
+    thread = threading.Thread(target=_target, daemon=True)
+    thread.start()
 
 
 def run_research_for_ui(
@@ -299,10 +428,13 @@ def run_research_for_ui(
 ) -> None:
     """Launch research in a daemon thread for the web UI.
 
+    At most ``settings.max_concurrent_jobs`` UI jobs run at once; the rest queue.
+
     Updates job_tracker at each phase. Uploads a consolidated KB doc to ElevenLabs.
     """
 
-    def _run():
+    async def _run():
+        loop = asyncio.get_running_loop()
         try:
             init_stats(job_id=job_id)
             update_job(
@@ -319,45 +451,44 @@ def run_research_for_ui(
 
             # Write initial metadata so query/depth survive process restart
             if settings.gcs_results_bucket:
-                gcs_client.upload_metadata({
+                await loop.run_in_executor(None, lambda: gcs_client.upload_metadata({
                     "job_id": job_id, "query": user_query,
                     "depth": depth.value.upper(), "status": "running",
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                }, job_id, settings.gcs_results_bucket)
+                    "created_at": _utcnow_iso(),
+                }, job_id, settings.gcs_results_bucket))
 
             # Progress callback for DEEP pipeline
+            progress = ProgressDebouncer(job_id)
+
             def _on_progress(phase, **kwargs):
                 updates = {"phase": phase}
                 if "step" in kwargs:
                     updates["current_step"] = kwargs["step"]
                     # Record phase timing (normalize study_N -> studies)
                     step = kwargs["step"]
-                    timing_key = "studies" if step.startswith("study_") else ("refinement" if step.startswith("gap_study_") else step)
-                    record_phase_timing(job_id, timing_key)
+                    record_phase_timing(job_id, _timing_key(step))
                 if "study_plan" in kwargs:
                     updates["study_plan"] = kwargs["study_plan"]
                 if "study_progress" in kwargs:
                     updates["study_progress"] = kwargs["study_progress"]
+                progress.push(**updates)
                 # Update individual study status
                 if "study_idx" in kwargs and "study_status" in kwargs:
-                    job = get_job(job_id)
-                    if job and job.study_progress:
-                        idx = kwargs["study_idx"]
-                        if idx < len(job.study_progress):
-                            job.study_progress[idx]["status"] = kwargs["study_status"]
-                update_job(job_id, **updates)
-
-            # Execute ADK research pipeline
-            update_job(job_id, phase=f"Running {depth.value.upper()} pipeline")
-            result = asyncio.run(
-                execute_research(query=user_query, context="", depth=depth,
-                                 on_progress=_on_progress,
-                                 gcs_bucket=settings.gcs_results_bucket,
-                                 business_context=business_context,
-                                 job_id=job_id)
-            )
+                    progress.set_study_status(kwargs["study_idx"], kwargs["study_status"])
 
-            _post_pipeline(job_id, user_query, depth, result, settings)
+            # Execute ADK research pipeline, then publish
+            update_job(job_id, phase=f"Running {depth.value.upper()} pipeline")
+            try:
+                result = await execute_research(
+                    query=user_query, context="", depth=depth,
+                    on_progress=_on_progress,
+                    gcs_bucket=settings.gcs_results_bucket,
+                    business_context=business_context,
+                    job_id=job_id,
+                )
+            finally:
+                progress.flush()
+            await _post_pipeline(job_id, user_query, depth, result, settings)
 
         except Exception as e:
             logger.exception("UI research failed: job=%s", job_id)
@@ -366,30 +497,53 @@ def run_research_for_ui(
                 status=JobStatus.FAILED,
                 phase="Failed",
                 error=str(e),
-                completed_at=datetime.now(timezone.utc).isoformat(),
+                completed_at=_utcnow_iso(),
             )
             # Update GCS metadata with failure status
             if settings.gcs_results_bucket:
-                gcs_client.update_metadata(job_id, settings.gcs_results_bucket, {
-                    "status": "failed", "error": str(e),
-                    "failed_at": datetime.now(timezone.utc).isoformat(),
-                })
+                await loop.run_in_executor(None, lambda: gcs_client.update_metadata(
+                    job_id, settings.gcs_results_bucket, {
+                        "status": "failed", "error": str(e),
+                        "failed_at": _utcnow_iso(),
+                    },
+                ))
 
-    thread = threading.Thread(target=_run, daemon=True)
-    thread.start()
+    _start_job_thread(job_id, _run, settings)
+
+
+async def _extract_both(text: str):
+    """Run memory and entity extraction in parallel."""
+    mem_task = extract_memories(text[:15000])
+    ent_task = extract_entities(text[:20000])
+    return await asyncio.gather(mem_task, ent_task)
+
+
+async def _post_pipeline(job_id, user_query, depth, result, settings):
+    """Post-pipeline steps shared between run and resume: KB upload, GCS, memory extraction.
+
+    Memory/entity extraction only needs the consolidated text, so it starts in the
+    background right away and overlaps the KB upload, agent attach and GCS publish.
+    Blocking HTTP/GCS calls run in the executor so they don't stall it.
+    """
+    loop = asyncio.get_running_loop()
 
+    # Built once and shared by the KB upload and the extraction phase
+    consolidated = _build_consolidated_text(result, user_query, depth.value)
+
+    # Extract memories + entities in the background
+    # Skip for QUICK depth to save API calls
+    extraction_task = None
+    if depth.value.upper() != "QUICK" and consolidated.strip():
+        extraction_task = asyncio.create_task(_extract_both(consolidated))
 
-def _post_pipeline(job_id, user_query, depth, result, settings):
-    """Post-pipeline steps shared between run and resume: KB upload, GCS, memory extraction."""
     # Upload consolidated KB doc to ElevenLabs
     elevenlabs_doc_id = ""
+    doc_name = f"Research: {user_query[:80]} ({job_id})"
     if settings.elevenlabs_api_key:
         update_job(job_id, phase="Uploading to knowledge base")
         try:
-            consolidated = _build_consolidated_text(result, user_query, depth.value)
             if consolidated.strip():
-                doc_name = f"Research: {user_query[:80]} ({job_id})"
-                elevenlabs_doc_id = _upload_with_retry(
+                elevenlabs_doc_id = await _upload_with_retry_async(
                     text=consolidated,
                     name=doc_name,
                     api_key=settings.elevenlabs_api_key,
@@ -398,56 +552,38 @@ def _post_pipeline(job_id, user_query, depth, result, settings):
         except Exception:
             logger.exception("Failed to upload consolidated KB doc for job %s", job_id)
 
-    # Auto-attach to all agents + trigger RAG indexing
+    # Auto-attach to all agents + trigger RAG indexing (for any future consumers)
     if elevenlabs_doc_id and settings.elevenlabs_api_key:
         update_job(job_id, phase="Assigning research to agents")
-        doc_name = f"Research: {user_query[:80]} ({job_id})"
+        agents = _configured_agents(settings)
+        results = await _attach_with_rag_index(agents, elevenlabs_doc_id, {elevenlabs_doc_id: doc_name}, settings)
         failed_agents = []
-        for slug in AGENTS:
-            agent_id = get_agent_id(slug, settings)
-            if not agent_id:
-                continue
-            try:
-                elevenlabs_client.attach_document_to_agent(
-                    agent_id=agent_id,
-                    doc_id=elevenlabs_doc_id,
-                    doc_name=doc_name,
-                    api_key=settings.elevenlabs_api_key,
-                )
+        for (slug, agent_id), err in zip(agents, results):
+            if err is None:
                 logger.info("Attached doc %s to agent %s (%s)", elevenlabs_doc_id, slug, agent_id)
-            except elevenlabs_client.RagIndexNotReadyError:
+            elif isinstance(err, elevenlabs_client.RagIndexNotReadyError):
                 logger.warning("RAG index not ready for agent %s (%s) — will retry", slug, agent_id)
                 failed_agents.append((slug, agent_id))
-            except Exception:
-                logger.exception("Failed to attach doc to agent %s", slug)
+            else:
+                logger.error("Failed to attach doc to agent %s", slug, exc_info=err)
 
         # Retry failed agents after a delay (RAG indexing may have caught up)
         if failed_agents:
-            import time
             logger.info("Waiting 60s before retrying %d failed agent attaches", len(failed_agents))
-            time.sleep(60)
-            for slug, agent_id in failed_agents:
-                try:
-                    elevenlabs_client.attach_document_to_agent(
-                        agent_id=agent_id,
-                        doc_id=elevenlabs_doc_id,
-                        doc_name=doc_name,
-                        api_key=settings.elevenlabs_api_key,
-                    )
-                    logger.info("Retry succeeded: attached doc %s to agent %s (%s)", elevenlabs_doc_id, slug, agent_id)
-                except Exception:
-                    logger.exception("Retry also failed for agent %s (%s)", slug, agent_id)
-
-        # Trigger both RAG index models (for any future consumers)
-        try:
-            elevenlabs_client.trigger_all_rag_indexes(
-                doc_id=elevenlabs_doc_id,
-                api_key=settings.elevenlabs_api_key,
+            await asyncio.sleep(60)
+            results = await _attach_concurrently(
+                elevenlabs_client.attach_documents_to_agent_async, failed_agents,
+                doc_map={elevenlabs_doc_id: doc_name}, api_key=settings.elevenlabs_api_key,
+                limit=settings.elevenlabs_max_concurrency,
             )
-        except Exception:
-            logger.exception("Failed to trigger RAG index for doc %s", elevenlabs_doc_id)
+            for (slug, agent_id), err in zip(failed_agents, results):
+                if err is None:
+                    logger.info("Retry succeeded: attached doc %s to agent %s (%s)", elevenlabs_doc_id, slug, agent_id)
+                else:
+                    logger.error("Retry also failed for agent %s (%s)", slug, agent_id, exc_info=err)
 
-    # Capture final research stats
+    # Capture final research stats (flushing any rate-limited push first)
+    flush_stats()
     final_stats = get_stats()
     num_studies = len(result.studies) if result.studies else 0
     num_qa = len([c for c in result.qa_clusters if c.findings]) if result.qa_clusters else 0
@@ -466,7 +602,7 @@ def _post_pipeline(job_id, user_query, depth, result, settings):
     result_url = ""
     notebooklm_urls = []
     if settings.gcs_results_bucket:
-        result_url = gcs_client.publish_results_with_metadata(
+        result_url = await loop.run_in_executor(None, lambda: gcs_client.publish_results_with_metadata(
             result,
             user_query,
             depth.value,
@@ -475,70 +611,58 @@ def _post_pipeline(job_id, user_query, depth, result, settings):
             elevenlabs_doc_id=elevenlabs_doc_id,
             phase_timings=timings,
             research_stats={**final_stats, "human_hours": human_hours},
-        )
+        ))
 
         # Publish individual NotebookLM source files
         try:
-            notebooklm_urls = gcs_client.publish_notebooklm_sources(
+            notebooklm_urls = await loop.run_in_executor(None, lambda: gcs_client.publish_notebooklm_sources(
                 result, user_query, job_id, settings.gcs_results_bucket,
-            )
+            ))
             if notebooklm_urls:
                 result.notebooklm_urls = notebooklm_urls
-                gcs_client.update_metadata(
+                await loop.run_in_executor(None, lambda: gcs_client.update_metadata(
                     job_id, settings.gcs_results_bucket,
                     {"notebooklm_urls": notebooklm_urls},
-                )
+                ))
                 logger.info("Published %d NotebookLM sources", len(notebooklm_urls))
         except Exception:
             logger.exception("Failed to publish NotebookLM sources (non-fatal)")
 
-    # Extract memories + entities in parallel
-    # Skip for QUICK depth to save API calls
-    if depth.value.upper() != "QUICK":
-        consolidated = _build_consolidated_text(result, user_query, depth.value)
-        if consolidated.strip():
-            update_job(job_id, phase="Extracting memories & knowledge graph")
-
-            async def _extract_both(text, _settings):
-                """Run memory and entity extraction in parallel."""
-                from app.agents.memory_extractor import extract_memories
-                from app.agents.entity_extractor import extract_entities
-                mem_task = extract_memories(text[:15000])
-                ent_task = extract_entities(text[:20000])
-                return await asyncio.gather(mem_task, ent_task)
-
-            try:
-                memories, extraction = asyncio.run(
-                    _extract_both(consolidated, settings)
-                )
+    # Join the background extraction and persist its output
+    if extraction_task is not None:
+        update_job(job_id, phase="Extracting memories & knowledge graph")
+        try:
+            memories, extraction = await extraction_task
 
-                # Save memories
-                if memories:
-                    try:
-                        from app.services import memory_store
-                        store = memory_store.load_memory(settings.gcs_results_bucket)
-                        added = memory_store.add_memories(store, memories, job_id, user_query)
-                        memory_store.save_memory(store, settings.gcs_results_bucket)
-                        logger.info("Added %d memories from job %s", added, job_id)
-                    except Exception:
-                        logger.exception("Memory save failed (non-fatal)")
+            # Save memories
+            if memories:
+                try:
+                    store = await loop.run_in_executor(
+                        None, memory_store.load_memory, settings.gcs_results_bucket,
+                    )
+                    added = memory_store.add_memories(store, memories, job_id, user_query)
+                    await loop.run_in_executor(
+                        None, memory_store.save_memory, store, settings.gcs_results_bucket,
+                    )
+                    logger.info("Added %d memories from job %s", added, job_id)
+                except Exception:
+                    logger.exception("Memory save failed (non-fatal)")
 
-                # Save entities
-                if extraction and extraction.get("entities"):
-                    try:
-                        from app.services import knowledge_graph as kg
-                        graph = kg.load_graph(settings.gcs_results_bucket)
-                        kg.merge_extraction(graph, extraction, job_id)
-                        kg.save_graph(graph, settings.gcs_results_bucket)
-                        logger.info(
-                            "Knowledge graph updated: +%d entities, +%d relationships",
-                            len(extraction.get("entities", [])),
-                            len(extraction.get("relationships", [])),
-                        )
-                    except Exception:
-                        logger.exception("Knowledge graph save failed (non-fatal)")
-            except Exception:
-                logger.exception("Parallel extraction failed (non-fatal)")
+            # Save entities
+            if extraction and extraction.get("entities"):
+                try:
+                    graph = await loop.run_in_executor(None, kg.load_graph, settings.gcs_results_bucket)
+                    kg.merge_extraction(graph, extraction, job_id)
+                    await loop.run_in_executor(None, kg.save_graph, graph, settings.gcs_results_bucket)
+                    logger.info(
+                        "Knowledge graph updated: +%d entities, +%d relationships",
+                        len(extraction.get("entities", [])),
+                        len(extraction.get("relationships", [])),
+                    )
+                except Exception:
+                    logger.exception("Knowledge graph save failed (non-fatal)")
+        except Exception:
+            logger.exception("Parallel extraction failed (non-fatal)")
 
     update_job(
         job_id,
@@ -547,7 +671,7 @@ def _post_pipeline(job_id, user_query, depth, result, settings):
         result_url=result_url,
         elevenlabs_doc_id=elevenlabs_doc_id,
         notebooklm_urls=notebooklm_urls,
-        completed_at=datetime.now(timezone.utc).isoformat(),
+        completed_at=_utcnow_iso(),
     )
     logger.info("UI research complete: job=%s url=%s doc_id=%s timings=%s", job_id, result_url, elevenlabs_doc_id, timings)
 
@@ -556,16 +680,19 @@ def resume_research_for_ui(
     job_id: str,
     settings: Settings,
 ) -> None:
-    """Resume a failed DEEP research job from its last checkpoint.
+    """Resume a failed DEEP research job from its last checkpoint (queued like new jobs).
 
     Reconstructs JobInfo from GCS metadata if not in memory,
     then re-runs the pipeline (checkpoint loading skips completed phases).
     """
 
-    def _run():
+    async def _run():
+        loop = asyncio.get_running_loop()
         try:
             # Reconstruct job from GCS metadata if process restarted
-            meta = gcs_client.get_result_metadata(job_id, settings.gcs_results_bucket)
+            meta = await loop.run_in_executor(
+                None, gcs_client.get_result_metadata, job_id, settings.gcs_results_bucket,
+            )
             if not meta:
                 logger.error("Cannot resume job %s: no metadata found", job_id)
                 return
@@ -587,42 +714,41 @@ def resume_research_for_ui(
             logger.info("Resuming research: job=%s query=%s", job_id, user_query[:100])
 
             # Update GCS metadata
-            gcs_client.update_metadata(job_id, settings.gcs_results_bucket, {
-                "status": "running",
-                "resumed_at": datetime.now(timezone.utc).isoformat(),
-            })
+            await loop.run_in_executor(None, lambda: gcs_client.update_metadata(
+                job_id, settings.gcs_results_bucket, {
+                    "status": "running",
+                    "resumed_at": _utcnow_iso(),
+                },
+            ))
 
             # Progress callback
+            progress = ProgressDebouncer(job_id)
+
             def _on_progress(phase, **kwargs):
                 updates = {"phase": phase}
                 if "step" in kwargs:
                     updates["current_step"] = kwargs["step"]
                     step = kwargs["step"]
-                    timing_key = "studies" if step.startswith("study_") else ("refinement" if step.startswith("gap_study_") else step)
-                    record_phase_timing(job_id, timing_key)
+                    record_phase_timing(job_id, _timing_key(step))
                 if "study_plan" in kwargs:
                     updates["study_plan"] = kwargs["study_plan"]
                 if "study_progress" in kwargs:
                     updates["study_progress"] = kwargs["study_progress"]
+                progress.push(**updates)
                 if "study_idx" in kwargs and "study_status" in kwargs:
-                    job = get_job(job_id)
-                    if job and job.study_progress:
-                        idx = kwargs["study_idx"]
-                        if idx < len(job.study_progress):
-                            job.study_progress[idx]["status"] = kwargs["study_status"]
-                update_job(job_id, **updates)
+                    progress.set_study_status(kwargs["study_idx"], kwargs["study_status"])
 
             # Execute pipeline — same job_id triggers checkpoint loading
-            result = asyncio.run(
-                execute_research(
+            try:
+                result = await execute_research(
                     query=user_query, context="", depth=depth,
                     on_progress=_on_progress,
                     gcs_bucket=settings.gcs_results_bucket,
                     job_id=job_id,
                 )
-            )
-
-            _post_pipeline(job_id, user_query, depth, result, settings)
+            finally:
+                progress.flush()
+            await _post_pipeline(job_id, user_query, depth, result, settings)
 
         except Exception as e:
             logger.exception("Resume failed: job=%s", job_id)
@@ -631,16 +757,17 @@ def resume_research_for_ui(
                 status=JobStatus.FAILED,
                 phase="Failed",
                 error=str(e),
-                completed_at=datetime.now(timezone.utc).isoformat(),
+                completed_at=_utcnow_iso(),
             )
             if settings.gcs_results_bucket:
-                gcs_client.update_metadata(job_id, settings.gcs_results_bucket, {
-                    "status": "failed", "error": str(e),
-                    "failed_at": datetime.now(timezone.utc).isoformat(),
-                })
+                await loop.run_in_executor(None, lambda: gcs_client.update_metadata(
+                    job_id, settings.gcs_results_bucket, {
+                        "status": "failed", "error": str(e),
+                        "failed_at": _utcnow_iso(),
+                    },
+                ))
 
-    thread = threading.Thread(target=_run, daemon=True)
-    thread.start()
+    _start_job_thread(job_id, _run, settings)
 
 
 def run_amendment_for_ui(
@@ -654,6 +781,8 @@ def run_amendment_for_ui(
     """Launch amendment pipeline in a daemon thread for the web UI."""
 
     def _run():
+        # One event loop shared by the amendment pipeline and the agent attaches
+        runner = async_runner.new_runner()
         try:
             update_job(
                 job_id,
@@ -662,19 +791,25 @@ def run_amendment_for_ui(
             )
             logger.info("Amendment started: job=%s parent=%s", job_id, parent_job_id)
 
-            # Fetch original result from GCS
+            # Fetch original result from GCS — prefer the raw synthesis JSON
             original_synthesis = ""
             if settings.gcs_results_bucket:
+                raw = gcs_client.get_result_json(parent_job_id, settings.gcs_results_bucket)
+                if raw:
+                    sections = (
+                        raw.get("master_synthesis") or raw.get("final_synthesis"),
+                        raw.get("strategic_analysis"),
+                        raw.get("qa_summary"),
+                    )
+                    original_synthesis = "\n\n".join(s for s in sections if s)[:40000]
+
+            # Older results predate the JSON sibling: scrape the HTML page instead
+            if not original_synthesis and settings.gcs_results_bucket:
                 meta = gcs_client.get_result_metadata(parent_job_id, settings.gcs_results_bucket)
                 if meta and meta.get("result_url"):
-                    # Download HTML and extract text
+                    # Stream the HTML and extract text
                     try:
-                        import requests, re
-                        resp = requests.get(meta["result_url"], timeout=30)
-                        resp.raise_for_status()
-                        text = re.sub(r"<[^>]+>", " ", resp.text)
-                        text = re.sub(r"\s+", " ", text).strip()
-                        original_synthesis = text[:40000]
+                        original_synthesis = runner.run(_fetch_html_text(meta["result_url"]))
                     except Exception:
                         logger.warning("Failed to fetch original result HTML, using metadata")
 
@@ -682,33 +817,37 @@ def run_amendment_for_ui(
                 original_synthesis = f"Original research query: {original_query}"
 
             # Progress callback
+            progress = ProgressDebouncer(job_id)
+
             def _on_progress(phase, **kwargs):
                 updates = {"phase": phase}
                 if "step" in kwargs:
                     updates["current_step"] = kwargs["step"]
                     step = kwargs["step"]
-                    timing_key = "studies" if step.startswith("study_") else ("refinement" if step.startswith("gap_study_") else step)
-                    record_phase_timing(job_id, timing_key)
-                update_job(job_id, **updates)
+                    record_phase_timing(job_id, _timing_key(step))
+                progress.push(**updates)
 
             # Execute amendment pipeline
             from app.agents.amendment_researcher import execute_amendment
-            result = asyncio.run(
-                execute_amendment(
-                    original_query=original_query,
-                    original_synthesis=original_synthesis,
-                    additional_questions=additional_questions,
-                    perspective=perspective,
-                    on_progress=_on_progress,
+            try:
+                result = runner.run(
+                    execute_amendment(
+                        original_query=original_query,
+                        original_synthesis=original_synthesis,
+                        additional_questions=additional_questions,
+                        perspective=perspective,
+                        on_progress=_on_progress,
+                    )
                 )
-            )
+            finally:
+                progress.flush()
 
             # Upload to ElevenLabs KB
             elevenlabs_doc_id = ""
+            doc_name = f"Amendment: {original_query[:60]} ({job_id})"
             if result.final_synthesis and settings.elevenlabs_api_key:
                 update_job(job_id, phase="Uploading to knowledge base")
                 try:
-                    doc_name = f"Amendment: {original_query[:60]} ({job_id})"
                     elevenlabs_doc_id = _upload_with_retry(
                         text=result.final_synthesis,
                         name=doc_name,
@@ -720,27 +859,13 @@ def run_amendment_for_ui(
             # Auto-attach to all agents
             if elevenlabs_doc_id and settings.elevenlabs_api_key:
                 update_job(job_id, phase="Assigning to agents")
-                doc_name = f"Amendment: {original_query[:60]} ({job_id})"
-                for slug in AGENTS:
-                    agent_id = get_agent_id(slug, settings)
-                    if not agent_id:
-                        continue
-                    try:
-                        elevenlabs_client.attach_document_to_agent(
-                            agent_id=agent_id,
-                            doc_id=elevenlabs_doc_id,
-                            doc_name=doc_name,
-                            api_key=settings.elevenlabs_api_key,
-                        )
-                    except Exception:
-                        logger.exception("Failed to attach amendment to agent %s", slug)
-                try:
-                    elevenlabs_client.trigger_all_rag_indexes(
-                        doc_id=elevenlabs_doc_id,
-                        api_key=settings.elevenlabs_api_key,
-                    )
-                except Exception:
-                    logger.exception("Failed to trigger RAG index for amendment")
+                agents = _configured_agents(settings)
+                results = runner.run(_attach_with_rag_index(
+                    agents, elevenlabs_doc_id, {elevenlabs_doc_id: doc_name}, settings,
+                ))
+                for (slug, _), err in zip(agents, results):
+                    if err is not None:
+                        logger.error("Failed to attach amendment to agent %s", slug, exc_info=err)
 
             # Finalize timings
             record_phase_timing(job_id, "upload")
@@ -771,7 +896,7 @@ def run_amendment_for_ui(
                 phase="Complete",
                 result_url=result_url,
                 elevenlabs_doc_id=elevenlabs_doc_id,
-                completed_at=datetime.now(timezone.utc).isoformat(),
+                completed_at=_utcnow_iso(),
             )
             logger.info("Amendment complete: job=%s url=%s", job_id, result_url)
 
@@ -782,34 +907,143 @@ def run_amendment_for_ui(
                 status=JobStatus.FAILED,
                 phase="Failed",
                 error=str(e),
-                completed_at=datetime.now(timezone.utc).isoformat(),
+                completed_at=_utcnow_iso(),
             )
+        finally:
+            runner.close()
 
     thread = threading.Thread(target=_run, daemon=True)
     thread.start()
 
 
+async def _fetch_html_text(url: str, max_chars: int = 40000) -> str:
+    """Stream an HTML page and strip its tags chunk by chunk as the bytes arrive."""
+    parts = []
+    carry = b""  # trailing "<..." of a tag split across chunk boundaries
+    async with httpx.AsyncClient(timeout=30) as client:
+        async with client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes():
+                data = carry + chunk
+                cut = data.rfind(b"<")
+                if cut != -1 and data.find(b">", cut) == -1:
+                    data, carry = data[:cut], data[cut:]
+                else:
+                    carry = b""
+                parts.append(_TAG_RE.sub(b" ", data))
+    parts.append(_TAG_RE.sub(b" ", carry))
+    text = _WS_RE.sub(b" ", b"".join(parts))
+    return text.decode("utf-8", "ignore").strip()[:max_chars]
+
+
+def _configured_agents(settings) -> list[tuple[str, str]]:
+    """Return (slug, agent_id) for every agent with an ID configured in settings."""
+    return [(slug, aid) for slug in AGENTS if (aid := get_agent_id(slug, settings))]
+
+
+async def _gather_bounded(coros, limit: int) -> list:
+    """Gather coroutines with at most ``limit`` in flight (keeps ElevenLabs under its rate limit)."""
+    sem = asyncio.Semaphore(max(1, limit))
+
+    async def _run(coro):
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(_run(c) for c in coros), return_exceptions=True)
+
+
+async def _attach_concurrently(attach, agents: list[tuple[str, str]], *, limit: int, **kwargs) -> list:
+    """Run ``attach(agent_id=aid, **kwargs)`` for every (slug, aid), ``limit`` at a time.
+
+    Returns one entry per agent, in order: None on success, or the exception raised.
+    """
+    return await _gather_bounded((attach(agent_id=aid, **kwargs) for _, aid in agents), limit)
+
+
+async def _attach_with_rag_index(agents: list[tuple[str, str]], doc_id: str, doc_map: dict, settings) -> list:
+    """Attach ``doc_map`` to every agent while both RAG index models for ``doc_id`` are triggered.
+
+    The index requests are independent of the attaches, so they run alongside
+    them. Returns the attach results as _attach_concurrently does.
+    """
+    _, results = await asyncio.gather(
+        elevenlabs_client.trigger_all_rag_indexes_async(doc_id, settings.elevenlabs_api_key),
+        _attach_concurrently(
+            elevenlabs_client.attach_documents_to_agent_async, agents,
+            doc_map=doc_map, api_key=settings.elevenlabs_api_key,
+            limit=settings.elevenlabs_max_concurrency,
+        ),
+    )
+    return results
+
+
+async def _upload_many_async(items: list[tuple[str, str]], api_key: str, limit: int) -> list:
+    """Upload (text, name) pairs to the KB, ``limit`` at a time.
+
+    Returns one entry per item, in order: the doc ID, or the exception raised.
+    """
+    return await _gather_bounded(
+        (_upload_with_retry_async(text=text, name=name, api_key=api_key) for text, name in items),
+        limit,
+    )
+
+
+# Failures worth another attempt: 5xx/429 from the KB, dropped connections, timeouts
+_RETRYABLE_ERRORS = (elevenlabs_client.KBServerError, requests.ConnectionError, requests.Timeout)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(MAX_DELAY, INITIAL_BACKOFF * 2**attempt)]."""
+    return random.uniform(0, min(MAX_DELAY, INITIAL_BACKOFF * (2 ** attempt)))
+
+
+async def _upload_with_retry_async(text: str, name: str, api_key: str) -> str:
+    """Async _upload_with_retry: backs off with asyncio.sleep so sibling uploads keep running."""
+    for attempt in range(MAX_RETRIES):
+        try:
+            return await elevenlabs_client.upload_to_knowledge_base_async(
+                text=text, name=name, api_key=api_key
+            )
+        except _RETRYABLE_ERRORS as e:
+            if attempt < MAX_RETRIES - 1:
+                delay = _backoff_delay(attempt)
+                logger.warning(
+                    "KB upload attempt %d failed, retrying in %.1fs: %s",
+                    attempt + 1,
+                    delay,
+                    e,
+                )
+                await asyncio.sleep(delay)
+            else:
+                logger.error("KB upload failed on attempt %d: %s", attempt + 1, e)
+                raise
+        except Exception as e:
+            logger.error("KB upload failed on attempt %d: %s", attempt + 1, e)
+            raise
+    return ""
+
+
 def _upload_with_retry(text: str, name: str, api_key: str) -> str:
-    """Upload to KB with exponential backoff on 5xx errors."""
-    backoff = INITIAL_BACKOFF
+    """Upload to KB with jittered exponential backoff on transient errors."""
     for attempt in range(MAX_RETRIES):
         try:
             return elevenlabs_client.upload_to_knowledge_base(
                 text=text, name=name, api_key=api_key
             )
-        except Exception as e:
-            error_str = str(e)
-            is_server_error = "500" in error_str or "502" in error_str or "503" in error_str
-            if is_server_error and attempt < MAX_RETRIES - 1:
+        except _RETRYABLE_ERRORS as e:
+            if attempt < MAX_RETRIES - 1:
+                delay = _backoff_delay(attempt)
                 logger.warning(
-                    "KB upload attempt %d failed (5xx), retrying in %ds: %s",
+                    "KB upload attempt %d failed, retrying in %.1fs: %s",
                     attempt + 1,
-                    backoff,
+                    delay,
                     e,
                 )
-                time.sleep(backoff)
-                backoff *= 2
+                time.sleep(delay)
             else:
                 logger.error("KB upload failed on attempt %d: %s", attempt + 1, e)
                 raise
+        except Exception as e:
+            logger.error("KB upload failed on attempt %d: %s", attempt + 1, e)
+            raise
     return ""
@@ -1,51 +1,135 @@
-"""Thread-local research statistics tracking.
+"""Per-job research statistics tracking.
 
 Tracks web searches, pages read, etc. per research job.
-Tool functions call increment() which auto-pushes stats to the job tracker.
+Tool functions call increment() which auto-pushes stats to the job tracker
+(rate-limited to one push per PUSH_INTERVAL, plus a trailing push).
+
+State lives in context variables rather than thread-locals so it follows the
+research coroutine, and the tasks it spawns, on the job's own event loop (see
+async_runner). Call init_stats() from inside that coroutine.
 """
 
 import threading
+import time
+from contextvars import ContextVar
+
+# Minimum spacing between pushes of the live counters to the job tracker (seconds)
+PUSH_INTERVAL = 0.5
+
+
+_update_job = None
+
+
+def _get_update_job():
+    """Return job_tracker.update_job, importing it on first use only."""
+    global _update_job
+    if _update_job is None:
+        from app.services.job_tracker import update_job
 
-_local = threading.local()
+        _update_job = update_job
+    return _update_job
+
+
+class _Counters:
+    """Fixed set of integer counters; slot attributes avoid per-increment dict hashing."""
+
+    __slots__ = (
+        "web_searches",
+        "urls_fetched",
+        "pages_read",
+        "news_searches",
+        "news_articles",
+        "grok_queries",
+        "reasoning_calls",
+    )
+
+    def __init__(self):
+        for key in self.__slots__:
+            setattr(self, key, 0)
+
+    def as_dict(self) -> dict:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+class _JobStats:
+    """Counters for one job plus the bookkeeping that rate-limits pushes."""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.counters = _Counters()
+        self.last_push = 0.0
+        self.timer: threading.Timer | None = None
+        self.lock = threading.Lock()
+
+    def push(self) -> None:
+        """Push now if the last push is old enough, else make sure a trailing push is scheduled."""
+        if not self.job_id:
+            return
+        with self.lock:
+            if time.monotonic() - self.last_push < PUSH_INTERVAL:
+                if self.timer is None:
+                    self.timer = threading.Timer(PUSH_INTERVAL, self.flush)
+                    self.timer.daemon = True
+                    self.timer.start()
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Push the current snapshot and cancel any pending trailing push."""
+        if not self.job_id:
+            return
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            self.last_push = time.monotonic()
+            snapshot = self.counters.as_dict()
+        _get_update_job()(self.job_id, research_stats=snapshot)
+
+
+_current: ContextVar[_JobStats | None] = ContextVar("research_stats", default=None)
 
 
 def init_stats(job_id: str = "") -> None:
-    """Initialize stats counters for the current thread."""
-    _local.stats = {
-        "web_searches": 0,
-        "urls_fetched": 0,
-        "pages_read": 0,
-        "news_searches": 0,
-        "news_articles": 0,
-        "grok_queries": 0,
-        "reasoning_calls": 0,
-    }
-    _local.job_id = job_id
+    """Initialize stats counters for the current job context."""
+    _current.set(_JobStats(job_id))
 
 
 def increment(key: str, amount: int = 1) -> None:
-    """Increment a stat counter and push to job tracker."""
-    stats = getattr(_local, "stats", None)
-    if stats is None:
+    """Increment a stat counter and push to job tracker (at most every PUSH_INTERVAL)."""
+    job = _current.get()
+    if job is None:
         return
-    stats[key] = stats.get(key, 0) + amount
-    _push_stats()
+    counters = job.counters
+    try:
+        setattr(counters, key, getattr(counters, key) + amount)
+    except AttributeError:
+        return  # not a tracked stat
+    job.push()
 
 
 def get_stats() -> dict:
     """Return current stats dict (copy)."""
-    stats = getattr(_local, "stats", None)
-    return dict(stats) if stats else {}
+    job = _current.get()
+    return job.counters.as_dict() if job else {}
 
 
-def _push_stats() -> None:
-    """Push current stats snapshot to the job tracker (if job_id set)."""
-    job_id = getattr(_local, "job_id", None)
-    stats = getattr(_local, "stats", None)
-    if job_id and stats:
-        from app.services.job_tracker import update_job
+def flush_stats() -> None:
+    """Push the latest counters to the job tracker now (call when a phase ends)."""
+    job = _current.get()
+    if job is not None:
+        job.flush()
+
+
+# Minutes of human effort per counted action, grouped by effort bucket
+_SEARCH_WEIGHTS = {"web_searches": 8, "news_searches": 8, "grok_queries": 8}
+_READ_WEIGHTS = {"pages_read": 5, "news_articles": 3}
+_ANALYZE_WEIGHTS = {"reasoning_calls": 15}
+
 
-        update_job(job_id, research_stats=dict(stats))
+def _weighted(stats: dict, weights: dict) -> int:
+    """Dot product of the stats counters with a weight table."""
+    return sum(stats.get(key, 0) * w for key, w in weights.items())
 
 
 def compute_human_hours(
@@ -65,13 +149,9 @@ def compute_human_hours(
     - Writing a synthesis report: 30 min (standard) or 120 min (deep)
     - Q&A preparation per cluster: ~30 min
     """
-    searching = (
-        stats.get("web_searches", 0)
-        + stats.get("news_searches", 0)
-        + stats.get("grok_queries", 0)
-    ) * 8
-    reading = stats.get("pages_read", 0) * 5 + stats.get("news_articles", 0) * 3
-    analyzing = stats.get("reasoning_calls", 0) * 15 + num_studies * 45
+    searching = _weighted(stats, _SEARCH_WEIGHTS)
+    reading = _weighted(stats, _READ_WEIGHTS)
+    analyzing = _weighted(stats, _ANALYZE_WEIGHTS) + num_studies * 45
     writing = 120 if depth.upper() == "DEEP" else 30
     qa_prep = num_qa_clusters * 30
 
@@ -3,13 +3,21 @@
 Zero API cost — uses a dictionary of known domains to rate authority.
 """
 
+import functools
 import logging
+import re
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Entries kept by the per-URL domain cache (keys are whole URLs)
+_DOMAIN_CACHE_SIZE = 4096
+# Entries kept by the per-hostname score cache; values are small tuples and
+# hosts recur across research sessions and watch checks
+_HOST_CACHE_SIZE = 50_000
+
 # High-authority domains: government, academic, major news, scientific
-TIER_HIGH = {
+TIER_HIGH = frozenset({
     # Government & international orgs
     "gov", "edu", "mil",
     "who.int", "worldbank.org", "imf.org", "oecd.org", "ecb.europa.eu",
@@ -26,10 +34,10 @@ TIER_HIGH = {
     # Data & statistics
     "data.gov", "census.gov", "bls.gov", "eurostat.ec.europa.eu",
     "statista.com",
-}
+})
 
 # Medium-authority domains: reputable media, industry analysis, reference
-TIER_MEDIUM = {
+TIER_MEDIUM = frozenset({
     # Reputable media
     "bbc.com", "cnbc.com", "cnn.com", "npr.org",
     "politico.com", "theatlantic.com", "newyorker.com",
@@ -46,21 +54,97 @@ TIER_MEDIUM = {
     # Forbes etc.
     "forbes.com", "businessinsider.com", "fortune.com",
     "inc.com", "entrepreneur.com",
-}
+})
 
 # Flags for source classification
-_ACADEMIC_TLDS = {"edu", "ac.uk", "edu.au"}
-_GOV_TLDS = {"gov", "mil", "gov.uk", "gov.au"}
-_NEWS_DOMAINS = {
+_ACADEMIC_TLDS = frozenset({"edu", "ac.uk", "edu.au"})
+_GOV_TLDS = frozenset({"gov", "mil", "gov.uk", "gov.au"})
+_NEWS_DOMAINS = frozenset({
     "reuters.com", "apnews.com", "bloomberg.com", "ft.com", "wsj.com",
     "nytimes.com", "bbc.com", "bbc.co.uk", "cnbc.com", "cnn.com",
     "theguardian.com", "npr.org", "washingtonpost.com", "economist.com",
-}
-_BLOG_INDICATORS = {"medium.com", "substack.com", "blogspot.com", "wordpress.com"}
+})
+_BLOG_INDICATORS = frozenset({"medium.com", "substack.com", "blogspot.com", "wordpress.com"})
+
+# Bits for the domain sets above; a hostname's mask ORs together every set
+# that contains one of its label-aligned suffixes (or the hostname itself).
+_HIGH = 1
+_MEDIUM = 2
+_GOV = 4
+_ACADEMIC = 8
+_NEWS = 16
+_BLOG = 32
+
+# Trie key holding the mask of a complete suffix (labels are always strings)
+_END = None
+
+
+def _build_suffix_trie(groups) -> dict:
+    """Build a dict-of-dicts trie over reversed domain labels ("bbc.co.uk" -> uk/co/bbc)."""
+    trie = {}
+    for bit, domains in groups:
+        for domain in domains:
+            node = trie
+            for label in reversed(domain.split(".")):
+                node = node.setdefault(label, {})
+            node[_END] = node.get(_END, 0) | bit
+    return trie
+
 
+_SUFFIX_TRIE = _build_suffix_trie((
+    (_HIGH, TIER_HIGH),
+    (_MEDIUM, TIER_MEDIUM),
+    (_GOV, _GOV_TLDS),
+    (_ACADEMIC, _ACADEMIC_TLDS),
+    (_NEWS, _NEWS_DOMAINS),
+    (_BLOG, _BLOG_INDICATORS),
+))
 
+
+def _classify(hostname: str) -> int:
+    """Walk the suffix trie from the rightmost label and return the combined set mask."""
+    mask = 0
+    node = _SUFFIX_TRIE
+    for label in reversed(hostname.split(".")):
+        node = node.get(label)
+        if node is None:
+            break
+        mask |= node.get(_END, 0)
+    return mask
+
+
+# URL scheme as accepted by urllib.parse
+_SCHEME_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*")
+# First character after the netloc
+_NETLOC_END_RE = re.compile(r"[/?#]")
+
+
+@functools.lru_cache(maxsize=_DOMAIN_CACHE_SIZE)
 def _extract_domain(url: str) -> str:
-    """Extract the registrable domain from a URL."""
+    """Extract the registrable domain from a URL.
+
+    Plain ASCII URLs are sliced directly (same result as urlparse's
+    .hostname); anything unusual — IPv6 literals, whitespace, non-ASCII,
+    odd schemes — goes through urlparse.
+    """
+    sep = url.find("://")
+    if (
+        url.isascii()
+        and url.isprintable()
+        and " " not in url
+        and (sep < 0 or _SCHEME_RE.fullmatch(url, 0, sep))
+    ):
+        start = sep + 3 if sep >= 0 else 0
+        end = _NETLOC_END_RE.search(url, start)
+        netloc = url[start:end.start() if end else len(url)]
+        if "[" not in netloc and "]" not in netloc:
+            host = netloc.rpartition("@")[2]
+            return host.partition(":")[0].lower().strip(".")
+    return _extract_domain_slow(url)
+
+
+def _extract_domain_slow(url: str) -> str:
+    """urlparse-based _extract_domain for URLs outside the fast path."""
     try:
         parsed = urlparse(url if "://" in url else f"https://{url}")
         hostname = (parsed.hostname or "").lower().strip(".")
@@ -77,51 +161,30 @@ def _get_tld(hostname: str) -> str:
     return ""
 
 
-def _get_root_domain(hostname: str) -> str:
-    """Get root domain (e.g., 'reuters.com' from 'www.reuters.com')."""
-    parts = hostname.split(".")
-    if len(parts) >= 2:
-        return ".".join(parts[-2:])
-    return hostname
-
+@functools.lru_cache(maxsize=_HOST_CACHE_SIZE)
+def _score_hostname(hostname: str) -> tuple[int, str, tuple[str, ...]]:
+    """Score a non-empty hostname as (score, tier, flags).
 
-def score_url(url: str) -> dict:
-    """Score a URL's authority based on domain reputation.
-
-    Returns:
-        {"authority_score": 0-10, "tier": "high"|"medium"|"low", "flags": [...]}
+    Authority depends only on the host, so results are cached per hostname;
+    flags come back as a tuple so the cached value cannot be mutated.
     """
-    hostname = _extract_domain(url)
-    if not hostname:
-        return {"authority_score": 2, "tier": "low", "flags": ["unknown"]}
-
+    mask = _classify(hostname)
     tld = _get_tld(hostname)
-    root = _get_root_domain(hostname)
     flags = []
 
-    # Check TLD-based classifications
-    if tld in _GOV_TLDS or any(hostname.endswith(f".{g}") for g in _GOV_TLDS):
+    # Domain-set classifications
+    if mask & _GOV:
         flags.append("government")
-    if tld in _ACADEMIC_TLDS or any(hostname.endswith(f".{a}") for a in _ACADEMIC_TLDS):
+    if mask & _ACADEMIC:
         flags.append("academic")
-    if root in _NEWS_DOMAINS or hostname in _NEWS_DOMAINS:
+    if mask & _NEWS:
         flags.append("news")
-    if root in _BLOG_INDICATORS or hostname in _BLOG_INDICATORS:
+    if mask & _BLOG:
         flags.append("blog")
 
-    # Check against tier dictionaries
-    # Match by: full hostname, root domain, or TLD
-    is_high = (
-        hostname in TIER_HIGH
-        or root in TIER_HIGH
-        or tld in TIER_HIGH
-        or any(hostname.endswith(f".{d}") for d in TIER_HIGH if "." not in d)
-    )
-
-    is_medium = (
-        hostname in TIER_MEDIUM
-        or root in TIER_MEDIUM
-    )
+    # Tier: the hostname or any parent domain (down to the bare TLD) is listed
+    is_high = mask & _HIGH
+    is_medium = mask & _MEDIUM
 
     if is_high:
         tier = "high"
@@ -143,14 +206,48 @@ def score_url(url: str) -> dict:
         elif not flags:
             flags.append("commercial" if tld == "com" else "general")
 
-    return {"authority_score": score, "tier": tier, "flags": flags}
+    return score, tier, tuple(flags)
+
+
+# Score for URLs with no usable hostname
+_UNKNOWN_SCORE = (2, "low", ("unknown",))
+
+
+def _score_tuple(url: str) -> tuple[int, str, tuple[str, ...]]:
+    """Score a URL as (score, tier, flags) via the per-host cache."""
+    hostname = _extract_domain(url)
+    return _score_hostname(hostname) if hostname else _UNKNOWN_SCORE
+
+
+def _as_dict(result: tuple[int, str, tuple[str, ...]]) -> dict:
+    """Expand a (score, tier, flags) tuple into the public score dict."""
+    score, tier, flags = result
+    return {"authority_score": score, "tier": tier, "flags": list(flags)}
+
+
+def score_url(url: str) -> dict:
+    """Score a URL's authority based on domain reputation.
+
+    Returns:
+        {"authority_score": 0-10, "tier": "high"|"medium"|"low", "flags": [...]}
+    """
+    return _as_dict(_score_tuple(url))
 
 
 def score_and_sort(urls: list[str]) -> list[tuple[str, dict]]:
-    """Score URLs and return sorted highest-authority first."""
-    scored = [(url, score_url(url)) for url in urls]
-    scored.sort(key=lambda x: x[1]["authority_score"], reverse=True)
-    return scored
+    """Score URLs and return sorted highest-authority first.
+
+    Sorts on the plain integer scores and only builds the result dicts at the
+    end, in output order. Ties keep their input order.
+    """
+    results = [_score_tuple(url) for url in urls]
+    scores = [result[0] for result in results]
+    order = sorted(range(len(urls)), key=scores.__getitem__, reverse=True)
+    return [(urls[i], _as_dict(results[i])) for i in order]
+
+
+# Upper-case tier names for authority tags
+_TIER_LABELS = {"high": "HIGH", "medium": "MEDIUM", "low": "LOW"}
 
 
 def format_authority_tag(score: dict) -> str:
@@ -158,7 +255,7 @@ def format_authority_tag(score: dict) -> str:
 
     Returns e.g. '[HIGH AUTHORITY: academic]' or '[LOW AUTHORITY: blog]'
     """
-    tier = score.get("tier", "low").upper()
-    flags = score.get("flags", [])
-    flag_str = ", ".join(flags) if flags else "general"
+    tier = score.get("tier", "low")
+    tier = _TIER_LABELS.get(tier) or tier.upper()
+    flag_str = ", ".join(score.get("flags", [])) or "general"
     return f"[{tier} AUTHORITY: {flag_str}]"
@@ -1,15 +1,25 @@
 """Watch store — manages research watches (topic monitors) in GCS."""
 
+import functools
 import hashlib
-import json
 import logging
 import secrets
-from dataclasses import dataclass, field, asdict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 WATCHES_PREFIX = "watches/"
+# Concurrent blob downloads in list_watches (within the storage client's pool)
+LIST_DOWNLOAD_WORKERS = 8
+# Check results kept per watch
+HISTORY_LIMIT = 20
+# Characters encoded per step when hashing findings
+_HASH_CHUNK_CHARS = 65_536
 
 
 @dataclass
@@ -32,18 +42,45 @@ class ResearchWatch:
     active: bool = True
     notification_email: str = ""
     notification_webhook: str = ""
+    # GCS generation this copy was loaded from / last saved as; None means
+    # unknown (new watch), so the next save is unconditional.
+    # Underscore-prefixed, so orjson leaves it out of the stored JSON.
+    _generation: int | None = field(default=None, init=False, repr=False, compare=False)
 
     def is_due(self) -> bool:
         """Check if this watch is due for a check."""
         if not self.last_checked:
             return True
         try:
-            last = datetime.fromisoformat(self.last_checked)
-            now = datetime.now(timezone.utc)
-            hours_since = (now - last).total_seconds() / 3600
-            return hours_since >= self.interval_hours
-        except Exception:
+            last = _iso_to_epoch(self.last_checked)
+        except (TypeError, ValueError):
             return True
+        return time.time() - last >= self.interval_hours * 3600
+
+
+@functools.lru_cache(maxsize=1024)
+def _iso_to_epoch(value: str) -> float:
+    """Parse an aware ISO-8601 timestamp to epoch seconds.
+
+    Cached because watches are reloaded from GCS on every listing while their
+    last_checked values rarely change.
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        raise ValueError(f"naive timestamp: {value!r}")
+    return parsed.timestamp()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_bucket(bucket_name: str):
+    """Return the bucket handle, building the storage client once per bucket.
+
+    Client construction does credential discovery and sets up an HTTP pool;
+    the client is thread-safe, so watch calls share it.
+    """
+    from google.cloud import storage
+
+    return storage.Client().bucket(bucket_name)
 
 
 def _watch_blob(watch_id: str) -> str:
@@ -53,7 +90,7 @@ def _watch_blob(watch_id: str) -> str:
 def create_watch(query: str, interval_hours: int, bucket_name: str) -> ResearchWatch:
     """Create a new research watch and save to GCS."""
     watch = ResearchWatch(
-        id=secrets.token_hex(6),
+        id=secrets.token_urlsafe(8),  # 64 random bits, URL- and blob-name-safe
         query=query,
         interval_hours=max(1, interval_hours),
         created_at=datetime.now(timezone.utc).isoformat(),
@@ -69,42 +106,48 @@ def get_watch(watch_id: str, bucket_name: str) -> ResearchWatch | None:
     if not bucket_name:
         return None
     try:
-        from google.cloud import storage
+        from google.api_core.exceptions import NotFound
 
-        client = storage.Client()
-        bucket = client.bucket(bucket_name)
+        bucket = _get_bucket(bucket_name)
         blob = bucket.blob(_watch_blob(watch_id))
-        if not blob.exists():
+        try:
+            data = orjson.loads(blob.download_as_bytes())
+        except NotFound:
             return None
-        data = json.loads(blob.download_as_text())
-        return ResearchWatch(**data)
+        watch = ResearchWatch(**data)
+        watch._generation = blob.generation
+        return watch
     except Exception:
         logger.exception("Failed to fetch watch %s", watch_id)
         return None
 
 
+def _load_watches(blobs) -> list[ResearchWatch]:
+    """Download and parse watch blobs, newest watch first (unparseable blobs are skipped)."""
+
+    def _load(blob) -> ResearchWatch | None:
+        try:
+            watch = ResearchWatch(**orjson.loads(blob.download_as_bytes()))
+            watch._generation = blob.generation
+            return watch
+        except Exception:
+            logger.warning("Failed to parse watch blob %s", blob.name)
+            return None
+
+    # Each download is an independent GET: fetch them concurrently
+    with ThreadPoolExecutor(max_workers=LIST_DOWNLOAD_WORKERS) as pool:
+        watches = [w for w in pool.map(_load, blobs) if w is not None]
+    watches.sort(key=lambda w: w.created_at, reverse=True)
+    return watches
+
+
 def list_watches(bucket_name: str) -> list[ResearchWatch]:
     """List all watches from GCS."""
     if not bucket_name:
         return []
     try:
-        from google.cloud import storage
-
-        client = storage.Client()
-        bucket = client.bucket(bucket_name)
-        blobs = list(bucket.list_blobs(prefix=WATCHES_PREFIX))
-
-        watches = []
-        for blob in blobs:
-            if not blob.name.endswith(".json"):
-                continue
-            try:
-                data = json.loads(blob.download_as_text())
-                watches.append(ResearchWatch(**data))
-            except Exception:
-                logger.warning("Failed to parse watch blob %s", blob.name)
-        watches.sort(key=lambda w: w.created_at, reverse=True)
-        return watches
+        bucket = _get_bucket(bucket_name)
+        return _load_watches(b for b in bucket.list_blobs(prefix=WATCHES_PREFIX) if b.name.endswith(".json"))
     except Exception:
         logger.exception("Failed to list watches")
         return []
@@ -115,28 +158,49 @@ def delete_watch(watch_id: str, bucket_name: str) -> bool:
     if not bucket_name:
         return False
     try:
-        from google.cloud import storage
+        from google.api_core.exceptions import NotFound
 
-        client = storage.Client()
-        bucket = client.bucket(bucket_name)
+        bucket = _get_bucket(bucket_name)
         blob = bucket.blob(_watch_blob(watch_id))
-        if blob.exists():
+        try:
             blob.delete()
-            logger.info("Deleted watch %s", watch_id)
-            return True
-        return False
+        except NotFound:
+            return False
+        logger.info("Deleted watch %s", watch_id)
+        return True
     except Exception:
         logger.exception("Failed to delete watch %s", watch_id)
         return False
 
 
+def _findings_hash(findings: str) -> str:
+    """First 16 hex chars of the SHA-256 of the UTF-8 findings.
+
+    Encodes and hashes in chunks so multi-MB findings never need a second
+    full-size copy as bytes.
+    """
+    h = hashlib.sha256()
+    for i in range(0, len(findings), _HASH_CHUNK_CHARS):
+        h.update(findings[i:i + _HASH_CHUNK_CHARS].encode())
+    return h.hexdigest()[:16]
+
+
+def _apply_check(watch: ResearchWatch, update: WatchUpdate) -> None:
+    """Fold a check result into the watch's state and history."""
+    watch.last_checked = update.checked_at
+    watch.last_findings_hash = update.findings_hash
+    watch.history.append(update.__dict__.copy())  # flat fields: no need for asdict
+    # Keep only the most recent entries (trimmed in place, no new list)
+    del watch.history[:-HISTORY_LIMIT]
+
+
 def record_check(watch: ResearchWatch, findings: str, bucket_name: str) -> WatchUpdate:
     """Record a check result for a watch.
 
     Compares findings hash to detect changes. Updates watch in GCS.
     """
     now = datetime.now(timezone.utc).isoformat()
-    findings_hash = hashlib.sha256(findings.encode()).hexdigest()[:16]
+    findings_hash = _findings_hash(findings)
     changed = findings_hash != watch.last_findings_hash and watch.last_findings_hash != ""
 
     update = WatchUpdate(
@@ -146,20 +210,61 @@ def record_check(watch: ResearchWatch, findings: str, bucket_name: str) -> Watch
         changed=changed,
     )
 
-    watch.last_checked = now
-    watch.last_findings_hash = findings_hash
-    watch.history.append(asdict(update))
-    # Keep only last 20 history entries
-    watch.history = watch.history[-20:]
+    _apply_check(watch, update)
+    if bucket_name:
+        try:
+            from google.api_core.exceptions import PreconditionFailed
 
-    _save_watch(watch, bucket_name)
+            try:
+                _upload_watch(watch, bucket_name)
+            except PreconditionFailed:
+                # Saved elsewhere since we loaded it: re-apply on the latest copy
+                logger.warning("Watch %s changed concurrently, re-applying check", watch.id)
+                latest = get_watch(watch.id, bucket_name)
+                if latest is not None:  # None: deleted meanwhile, don't resurrect it
+                    _apply_check(latest, update)
+                    _save_watch(latest, bucket_name)
+        except Exception:
+            logger.exception("Failed to save watch %s", watch.id)
     logger.info("Watch %s checked: changed=%s hash=%s", watch.id, changed, findings_hash)
     return update
 
 
+def _might_be_due(blob) -> bool:
+    """Decide from a listed blob's custom metadata whether its watch may be due.
+
+    Watches saved before the metadata was written have none and are always
+    downloaded; the caller re-checks the full watch either way.
+    """
+    meta = blob.metadata or {}
+    if "active" not in meta:
+        return True
+    if meta["active"] != "True":
+        return False
+    try:
+        interval_hours = int(meta.get("interval_hours", "0"))
+    except ValueError:
+        return True
+    return ResearchWatch(last_checked=meta.get("last_checked", ""), interval_hours=interval_hours).is_due()
+
+
 def get_due_watches(bucket_name: str) -> list[ResearchWatch]:
-    """Get all watches that are due for checking."""
-    watches = list_watches(bucket_name)
+    """Get all watches that are due for checking.
+
+    Filters on the blob metadata returned by the listing, so only watches
+    that are (probably) due are downloaded.
+    """
+    if not bucket_name:
+        return []
+    try:
+        bucket = _get_bucket(bucket_name)
+        watches = _load_watches(
+            b for b in bucket.list_blobs(prefix=WATCHES_PREFIX)
+            if b.name.endswith(".json") and _might_be_due(b)
+        )
+    except Exception:
+        logger.exception("Failed to list due watches")
+        return []
     return [w for w in watches if w.active and w.is_due()]
 
 
@@ -168,14 +273,30 @@ def _save_watch(watch: ResearchWatch, bucket_name: str) -> None:
     if not bucket_name:
         return
     try:
-        from google.cloud import storage
-
-        client = storage.Client()
-        bucket = client.bucket(bucket_name)
-        blob = bucket.blob(_watch_blob(watch.id))
-        blob.upload_from_string(
-            json.dumps(asdict(watch), indent=2),
-            content_type="application/json",
-        )
+        _upload_watch(watch, bucket_name)
     except Exception:
         logger.exception("Failed to save watch %s", watch.id)
+
+
+def _upload_watch(watch: ResearchWatch, bucket_name: str) -> None:
+    """Upload a watch; one loaded from GCS only replaces the generation it came from.
+
+    Raises google.api_core PreconditionFailed when another writer saved (or
+    deleted) the watch in between, instead of silently overwriting them.
+    """
+    bucket = _get_bucket(bucket_name)
+    blob = bucket.blob(_watch_blob(watch.id))
+    # Scheduling fields as custom metadata: get_due_watches filters on the
+    # listing without downloading every watch
+    blob.metadata = {
+        "last_checked": watch.last_checked,
+        "interval_hours": str(watch.interval_hours),
+        "active": str(watch.active),
+    }
+    # orjson serializes the dataclass directly (no asdict copy); compact output
+    blob.upload_from_string(
+        orjson.dumps(watch),
+        content_type="application/json",
+        if_generation_match=watch._generation,
+    )
+    watch._generation = blob.generation
@@ -0,0 +1,34 @@
+import time
+
+from app.services import job_tracker
+from app.services.job_tracker import ProgressDebouncer
+
+
+def _plan(n):
+    return {
+        "phase": f"Planned {n} studies",
+        "current_step": "studies",
+        "study_plan": [{"title": f"S{i}", "angle": ""} for i in range(n)],
+        "study_progress": [{"title": f"S{i}", "status": "pending", "rounds": 0} for i in range(n)],
+    }
+
+
+def test_study_status_right_after_plan_is_kept():
+    job_id = job_tracker.create_job("q", "DEEP")
+    progress = ProgressDebouncer(job_id, interval=0.5)
+
+    progress.push(**_plan(3))
+    progress.push(phase="Restored: S0", current_step="study_0")
+    progress.set_study_status(0, "done")
+    progress.push(phase="Researching: S1", current_step="study_1")
+    progress.set_study_status(1, "running")
+    progress.push(phase="Researching: S1 (round 2)", current_step="study_1")
+
+    time.sleep(0.7)  # let the trailing timer write
+    job = job_tracker.get_job(job_id)
+    assert [s["status"] for s in job.study_progress] == ["done", "running", "pending"]
+    assert job.phase == "Researching: S1 (round 2)"
+
+    progress.flush()
+    assert [s["status"] for s in job_tracker.get_job(job_id).study_progress] == ["done", "running", "pending"]
+